@@ -0,0 +1,281 @@
+import argparse
+import gzip
+import json
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import cycle, islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from constants import COORDINATES_TOLERANCE  # noqa: E402
+from fake_server.payloads import (  # noqa: E402
+    forecast_entry,
+    load_locations,
+    weather_payload,
+)
+from helpers.assertions import (  # noqa: E402
+    assert_all_within_tolerance,
+    assert_city_name,
+    assert_coordinates_match,
+    assert_forecast_entries_valid,
+    assert_status_code_and_valid_json,
+    assert_within_tolerance,
+)
+from helpers.get_temperature import (  # noqa: E402
+    extract_temperature,
+    get_temperature_for_city,
+)
+from services.serialization import deserialize_response  # noqa: E402
+from services.weather_service import WeatherService  # noqa: E402
+from utils.schema_registry import (  # noqa: E402
+    FORECAST_ENTRY_PATH,
+    get_validator,
+    validate_many,
+)
+from utils.temp_converter import kelvin_to_celsius  # noqa: E402
+from utils.unit_converter import METRIC, STANDARD, convert_temperature  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "client_stack.json"
+DEFAULT_SIZES = "1,100,10000,100000"
+START_TIME = 1_700_000_000
+FORECAST_STEP = 3 * 3600
+
+
+def generated_weather_bodies() -> list[bytes]:
+    return [
+        json.dumps(weather_payload(location, START_TIME)).encode("utf-8")
+        for location in load_locations()
+    ]
+
+
+def recorded_weather_bodies(path: Path) -> list[bytes]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    return [
+        entry["body"]["text"].encode("utf-8")
+        for key, entry in entries.items()
+        if json.loads(key)[0] == "/weather" and entry["status"] == 200
+    ]
+
+
+def make_response(body: bytes):
+    return deserialize_response(
+        {
+            "status": 200,
+            "reason": "OK",
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
+            "url": "https://example.invalid/weather",
+            "elapsed": 0.0,
+            "body": {"text": body.decode("utf-8")},
+        }
+    )
+
+
+def build_inputs(size: int, bodies: list[bytes]) -> dict:
+    responses = [make_response(body) for body in islice(cycle(bodies), size)]
+    data = [response.json() for response in responses]
+    locations = list(islice(cycle(load_locations()), size))
+    entries = [
+        forecast_entry(location, START_TIME + index * FORECAST_STEP)
+        for index, location in enumerate(locations)
+    ]
+    temps = array("d", (item["main"]["temp"] for item in data))
+
+    return {
+        "responses": responses,
+        "data": data,
+        "entries": entries,
+        "temps": temps,
+        "expected_temps": array("d", (temp + 0.5 for temp in temps)),
+    }
+
+
+def cases(service: WeatherService) -> dict:
+    weather_validator = get_validator("weather_schema.json")
+
+    def each(check):
+        return lambda inputs: [check(item) for item in inputs["data"]]
+
+    return {
+        "json_parse": lambda inputs: [
+            response.json() for response in inputs["responses"]
+        ],
+        "schema_validate_weather": each(weather_validator.validate),
+        "schema_validate_forecast_entries": lambda inputs: validate_many(
+            inputs["entries"], "forecast_schema.json", FORECAST_ENTRY_PATH
+        ),
+        "assert_status_code_and_valid_json": lambda inputs: [
+            assert_status_code_and_valid_json(response)
+            for response in inputs["responses"]
+        ],
+        "assert_city_name": each(lambda item: assert_city_name(item, item["name"])),
+        "assert_within_tolerance": each(
+            lambda item: assert_within_tolerance(
+                item["main"]["temp"], item["main"]["feels_like"], 100.0
+            )
+        ),
+        "assert_coordinates_match": each(
+            lambda item: assert_coordinates_match(
+                item["coord"]["lat"],
+                item["coord"]["lon"],
+                item["coord"]["lat"],
+                item["coord"]["lon"],
+                COORDINATES_TOLERANCE,
+            )
+        ),
+        "assert_all_within_tolerance": lambda inputs: assert_all_within_tolerance(
+            inputs["temps"], inputs["expected_temps"], 1.0
+        ),
+        "assert_forecast_entries_valid": lambda inputs: assert_forecast_entries_valid(
+            inputs["entries"]
+        ),
+        "kelvin_to_celsius": lambda inputs: [
+            kelvin_to_celsius(temp) for temp in inputs["temps"]
+        ],
+        "convert_temperature_series": lambda inputs: convert_temperature(
+            inputs["temps"], STANDARD, METRIC
+        ),
+        "extract_temperature": each(lambda item: extract_temperature(service, item)),
+        "get_temperature_for_city": each(
+            lambda item: get_temperature_for_city(service, "", data=item)
+        ),
+    }
+
+
+def measure(case, inputs: dict, size: int, min_time: float) -> dict:
+    runs = 0
+    best = float("inf")
+    started = time.perf_counter()
+
+    while runs == 0 or time.perf_counter() - started < min_time:
+        start = time.perf_counter()
+        case(inputs)
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+
+    tracemalloc.start()
+    case(inputs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"ops_per_sec": size / best if best else float("inf"), "peak_bytes": peak}
+
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if result["ops_per_sec"] < previous["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:.0f} ops/s, "
+                f"baseline {previous['ops_per_sec']:.0f} ops/s"
+            )
+        if result["peak_bytes"] > max(previous["peak_bytes"], 4096) * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak {result['peak_bytes']} B, "
+                f"baseline {previous['peak_bytes']} B"
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline benchmarks for parsing, validation, assertions and "
+        "temperature helpers"
+    )
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help="comma-separated payload counts"
+    )
+    parser.add_argument("--case", action="append", help="run only these cases")
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        help="use the /weather bodies recorded in this cassette instead of "
+        "generated ones",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="seconds each case keeps repeating, the best run is reported",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH}"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit 1 if ops/sec drops or peak memory grows by more than --tolerance",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+
+    bodies = (
+        recorded_weather_bodies(args.cassette)
+        if args.cassette
+        else generated_weather_bodies()
+    )
+    if not bodies:
+        parser.error(f"No recorded /weather responses in {args.cassette}")
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    selected = {
+        name: case
+        for name, case in cases(WeatherService(None)).items()
+        if not args.case or name in args.case
+    }
+    results = {}
+
+    print(f"{'case':<36}{'size':>8}{'ops/sec':>14}{'peak KB':>11}")
+    for size in sizes:
+        inputs = build_inputs(size, bodies)
+        for name, case in selected.items():
+            result = measure(case, inputs, size, args.min_time)
+            results[f"{name}@{size}"] = result
+            print(
+                f"{name:<36}{size:>8}{result['ops_per_sec']:>14,.0f}"
+                f"{result['peak_bytes'] / 1024:>11.1f}"
+            )
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        baseline = load_baseline()
+        baseline.update(
+            {
+                name: {
+                    "ops_per_sec": round(result["ops_per_sec"], 1),
+                    "peak_bytes": result["peak_bytes"],
+                }
+                for name, result in results.items()
+            }
+        )
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {BASELINE_PATH}")
+
+    if args.check:
+        baseline = load_baseline()
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"regressed by more than {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("no regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_server.owm_server import FakeOwmServer  # noqa: E402
+from services.api_client import ApiClient  # noqa: E402
+
+
+def time_calls(get, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        get().raise_for_status()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-call connections with the pooled ApiClient session"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with FakeOwmServer() as server:
+        params = {"q": "Warsaw", "appid": server.api_key}
+        before = time_calls(
+            lambda: requests.get(f"{server.url}/weather", params=params, timeout=10),
+            args.requests,
+        )
+        with ApiClient(base_url=server.url) as client:
+            after = time_calls(lambda: client.get("/weather", params), args.requests)
+
+    print(f"requests:            {args.requests}")
+    for label, seconds in (("new connection/call", before), ("pooled session", after)):
+        per_call = seconds / args.requests * 1000
+        print(f"{label + ':':<21}{seconds:.3f}s ({per_call:.2f} ms/call)")
+    print(f"speedup:             {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_server.payloads import (  # noqa: E402
+    forecast_payload,
+    load_locations,
+    weather_payload,
+)
+from services.json_decoding import (  # noqa: E402
+    available_backends,
+    get_decoder,
+    with_decoder,
+)
+
+START_TIME = 1_700_000_000
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def ops_per_sec(call, min_time: float) -> float:
+    calls = 0
+    start = time.perf_counter()
+
+    while (elapsed := time.perf_counter() - start) < min_time:
+        for _ in range(100):
+            call()
+        calls += 100
+
+    return calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare JSON decoding backends on weather and forecast bodies"
+    )
+    parser.add_argument("--min-time", type=float, default=1.0)
+    args = parser.parse_args()
+
+    location = load_locations()[0]
+    payloads = {
+        "weather": json.dumps(weather_payload(location, START_TIME)).encode("utf-8"),
+        "forecast": json.dumps(forecast_payload(location, START_TIME)).encode("utf-8"),
+    }
+
+    print(
+        f"{'payload':<10}{'bytes':>8}  {'decoder':<22}"
+        f"{'ops/sec':>12}{'MB/s':>9}{'speedup':>9}"
+    )
+    for name, body in payloads.items():
+        plain = make_response(body)
+        candidates = {"requests Response.json": plain.json}
+        for backend in available_backends():
+            decoded = with_decoder(make_response(body), get_decoder(backend))
+            candidates[f"{backend} from bytes"] = decoded.json
+
+        reference = None
+        for label, call in candidates.items():
+            rate = ops_per_sec(call, args.min_time)
+            reference = reference or rate
+            print(
+                f"{name:<10}{len(body):>8}  {label:<22}{rate:>12,.0f}"
+                f"{rate * len(body) / 1e6:>9.1f}{rate / reference:>8.2f}x"
+            )
+
+    if len(available_backends()) == 1:
+        print("orjson is not installed, only the stdlib backend was measured")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "startup.json"
+
+SCENARIOS = {
+    "import_conftest": [sys.executable, "-c", "import conftest"],
+    "collect_only": [
+        sys.executable,
+        "-m",
+        "pytest",
+        "--collect-only",
+        "-q",
+        "-p",
+        "no:cacheprovider",
+    ],
+    "negative_smoke": [
+        sys.executable,
+        "-m",
+        "pytest",
+        "-q",
+        "-m",
+        "negative",
+        "--fake-server",
+        "-p",
+        "no:cacheprovider",
+        "--timing-report",
+        "reports/bench_startup_timing.json",
+    ],
+}
+
+
+def time_command(command: list[str], repeat: int) -> float:
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        durations.append(time.perf_counter() - start)
+
+        if completed.returncode != 0:
+            output = (completed.stdout + completed.stderr).strip().splitlines()
+            sys.exit(
+                f"{' '.join(command[1:])} exited with {completed.returncode}, "
+                "timings of failed runs are not comparable:\n"
+                + "\n".join(output[-20:])
+            )
+
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time interpreter startup, test collection and a negative smoke run"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH}"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit 1 if any scenario is slower than the baseline by more than "
+        "--tolerance",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = {
+        name: time_command(command, args.repeat) for name, command in SCENARIOS.items()
+    }
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    regressions = []
+
+    for name, seconds in results.items():
+        line = f"{name:<16} {seconds * 1000:8.1f} ms"
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            line += f"  (baseline {baseline[name] * 1000:.1f} ms, {change:+.0%})"
+            if change > args.tolerance:
+                regressions.append(name)
+        print(line)
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        rounded = {name: round(seconds, 4) for name, seconds in results.items()}
+        BASELINE_PATH.write_text(json.dumps(rounded, indent=2) + "\n")
+        print(f"baseline written to {BASELINE_PATH}")
+
+    if args.check and regressions:
+        print(f"regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,403 @@
+from __future__ import annotations
+
 import os
+import re
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
 import pytest
+from constants import LOAD_TEST_CONCURRENCY, LOAD_TEST_DURATION_SECONDS
+from helpers.load_runner import write_report
 from services.api_client import ApiClient
+from services.async_api_client import AsyncApiClient
+from services.async_weather_service import AsyncWeatherService
+from services.async_forecast_service import AsyncForecastService
+from services.cassette import REPLAY, SECRET_PLACEHOLDER, Cassette
+from services.http_cache import HttpCache
+from services.quota import QuotaTracker
+from services.rate_limiter import RateLimiter
+from services.resilience import CircuitBreaker, HedgePolicy
+from services.response_cache import ResponseCache
+from services.shared_response_cache import SharedResponseCache
 from services.weather_service import WeatherService
 from services.forecast_service import ForecastService
-from dotenv import load_dotenv
-from utils.cities_loader import load_cities
-from utils.schema_loader import load_schema
+from utils.cities_loader import load_cities, load_city_locations
+from utils.geo_index import GeoIndex
+from utils.schema_registry import get_schema, get_validator
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+    from fake_server.owm_server import FakeOwmServer
+
+DOTENV_PATH = Path(__file__).resolve().parent / ".env"
+
+if DOTENV_PATH.exists():
+    from dotenv import load_dotenv
+
+    load_dotenv(DOTENV_PATH)
+
+pytest_plugins = [
+    "plugins.request_timing",
+    "plugins.city_data",
+    "plugins.prefetch",
+]
+
+quota_tracker_key = pytest.StashKey[QuotaTracker]()
+load_results_key = pytest.StashKey[dict]()
+
+
+def is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--calls-per-minute",
+        type=int,
+        default=int(os.getenv("API_CALLS_PER_MINUTE", "60")),
+        help="client-side API rate limit per minute (0 disables it)",
+    )
+    parser.addoption(
+        "--calls-per-day",
+        type=int,
+        default=int(os.getenv("API_CALLS_PER_DAY", "0")),
+        help="client-side API rate limit per day (0 disables it)",
+    )
+    parser.addoption(
+        "--record-mode",
+        choices=("none", "record", "replay"),
+        default=os.getenv("API_RECORD_MODE", "none"),
+        help="record API responses to the cassette, or replay them without network",
+    )
+    parser.addoption(
+        "--cassette",
+        default=os.getenv("API_CASSETTE", "cassettes/openweathermap.json.gz"),
+        help="cassette file used by --record-mode",
+    )
+    parser.addoption(
+        "--base-url",
+        default=os.getenv("API_BASE_URL"),
+        help="API base URL, defaults to ApiClient.BASE_URL",
+    )
+    parser.addoption(
+        "--fake-server",
+        action="store_true",
+        help="run against a local OpenWeatherMap stand-in instead of the real API",
+    )
+    parser.addoption(
+        "--fake-latency",
+        default="none",
+        help="latency distribution of the stand-in, e.g. uniform:0.01,0.05",
+    )
+    parser.addoption(
+        "--http-cache",
+        default=os.getenv("API_HTTP_CACHE", ".http_cache"),
+        help="directory of the on-disk HTTP cache shared between runs",
+    )
+    parser.addoption(
+        "--http-cache-size",
+        type=int,
+        default=64,
+        help="size limit of the HTTP cache in MB",
+    )
+    parser.addoption(
+        "--http-cache-ttl",
+        type=float,
+        default=600.0,
+        help="seconds a response without Cache-Control/Expires stays fresh",
+    )
+    parser.addoption(
+        "--no-http-cache",
+        action="store_true",
+        help="always download full responses instead of using the HTTP cache",
+    )
+    parser.addoption(
+        "--json-backend",
+        choices=("auto", "stdlib", "orjson"),
+        default="auto",
+        help="JSON decoder for API responses, auto uses orjson when installed",
+    )
+    parser.addoption(
+        "--hedge",
+        action="store_true",
+        help="send a duplicate request when a call runs past the observed p95",
+    )
+    parser.addoption(
+        "--circuit-breaker-threshold",
+        type=int,
+        default=5,
+        help="consecutive failures that open an endpoint's circuit (0 disables it)",
+    )
+    parser.addoption(
+        "--load-concurrency",
+        type=int,
+        default=LOAD_TEST_CONCURRENCY,
+        help="number of concurrent callers in load tests",
+    )
+    parser.addoption(
+        "--load-duration",
+        type=float,
+        default=LOAD_TEST_DURATION_SECONDS,
+        help="seconds each load test keeps calling its endpoint",
+    )
+    parser.addoption(
+        "--load-report",
+        default="reports/load_results.json",
+        help="JSON file the load test results are written to",
+    )
+
+
+def pytest_configure(config):
+    config.stash[quota_tracker_key] = QuotaTracker()
+    config.stash[load_results_key] = {}
+
+
+def load_tests_selected(config) -> bool:
+    if config.getoption("fake_server") or config.getoption("base_url"):
+        return True
+    markexpr = config.getoption("markexpr") or ""
+    return re.search(r"(?<!not )\b(performance|load)\b", markexpr) is not None
+
+
+def pytest_collection_modifyitems(config, items):
+    if load_tests_selected(config):
+        return
 
-load_dotenv()
+    skip_load = pytest.mark.skip(
+        reason="load tests run only with -m performance, --fake-server or --base-url"
+    )
+    for item in items:
+        if item.get_closest_marker("load") is not None:
+            item.add_marker(skip_load)
 
 
-@pytest.fixture
-def api_key() -> str | None:
+def pytest_sessionfinish(session):
+    config = session.config
+    quota = config.stash[quota_tracker_key]
+    load_results = config.stash[load_results_key]
+
+    if is_xdist_worker(config):
+        config.workeroutput["quota"] = quota.to_dict()
+        config.workeroutput["load_results"] = load_results
+        return
+
+    if load_results:
+        write_report(
+            config.rootpath / config.getoption("load_report"),
+            load_results,
+            {
+                "concurrency": config.getoption("load_concurrency"),
+                "duration": config.getoption("load_duration"),
+                "fake_server": config.getoption("fake_server"),
+            },
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+
+    if "quota" in output:
+        node.config.stash[quota_tracker_key].merge(output["quota"])
+    node.config.stash[load_results_key].update(output.get("load_results", {}))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    quota = config.stash[quota_tracker_key]
+
+    terminalreporter.write_sep("=", "API quota report")
+    for line in quota.report_lines():
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def fake_server(pytestconfig) -> FakeOwmServer | None:
+    if not pytestconfig.getoption("fake_server"):
+        yield None
+        return
+
+    from fake_server.owm_server import FakeOwmServer
+
+    with FakeOwmServer(latency=pytestconfig.getoption("fake_latency")) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def api_key(pytestconfig, fake_server) -> str | None:
+    if fake_server is not None:
+        return fake_server.api_key
+
     key = os.getenv("API_KEY")
 
+    if not key and pytestconfig.getoption("record_mode") == REPLAY:
+        return SECRET_PLACEHOLDER
     if not key:
         pytest.skip("API KEY is not set")
     return key
 
 
-@pytest.fixture
-def client() -> ApiClient:
-    return ApiClient()
+@pytest.fixture(scope="session")
+def rate_limiter(pytestconfig, fake_server) -> RateLimiter | None:
+    if fake_server is not None:
+        return None
+
+    return RateLimiter(
+        calls_per_minute=pytestconfig.getoption("calls_per_minute"),
+        calls_per_day=pytestconfig.getoption("calls_per_day"),
+        state_path=Path(tempfile.gettempdir()) / "owm-api-rate-limiter.json",
+    )
+
 
+@pytest.fixture(scope="session")
+def cassette(pytestconfig, geo_index) -> Cassette | None:
+    mode = pytestconfig.getoption("record_mode")
 
-@pytest.fixture
+    if mode == "none":
+        yield None
+        return
+
+    path = pytestconfig.rootpath / pytestconfig.getoption("cassette")
+    recorder = Cassette(
+        path, mode, secrets=(os.getenv("API_KEY"),), geo_index=geo_index
+    )
+    yield recorder
+    recorder.save()
+
+
+@pytest.fixture(scope="session")
+def geo_index() -> GeoIndex:
+    return GeoIndex.load()
+
+
+@pytest.fixture(scope="session")
+def response_cache(
+    pytestconfig, tmp_path_factory, geo_index
+) -> ResponseCache | SharedResponseCache:
+    if is_xdist_worker(pytestconfig):
+        shared_dir = tmp_path_factory.getbasetemp().parent / "response-cache"
+        return SharedResponseCache(shared_dir, geo_index=geo_index)
+
+    return ResponseCache(geo_index=geo_index)
+
+
+@pytest.fixture(scope="session")
+def http_cache(pytestconfig, cassette) -> HttpCache | None:
+    if pytestconfig.getoption("no_http_cache") or cassette is not None:
+        return None
+
+    return HttpCache(
+        pytestconfig.rootpath / pytestconfig.getoption("http_cache"),
+        max_bytes=pytestconfig.getoption("http_cache_size") * 1024 * 1024,
+        default_ttl=pytestconfig.getoption("http_cache_ttl"),
+    )
+
+
+@pytest.fixture(scope="session")
+def client(
+    pytestconfig,
+    fake_server,
+    rate_limiter,
+    cassette,
+    response_cache,
+    http_cache,
+    request_timing,
+) -> ApiClient:
+    base_url = fake_server.url if fake_server else pytestconfig.getoption("base_url")
+    threshold = pytestconfig.getoption("circuit_breaker_threshold")
+
+    with ApiClient(
+        base_url=base_url,
+        cache=response_cache,
+        rate_limiter=rate_limiter,
+        observers=[
+            pytestconfig.stash[quota_tracker_key],
+            request_timing,
+        ],
+        cassette=cassette,
+        http_cache=http_cache,
+        json_backend=pytestconfig.getoption("json_backend"),
+        hedge=HedgePolicy() if pytestconfig.getoption("hedge") else None,
+        circuit_breaker=CircuitBreaker(threshold) if threshold else None,
+    ) as api_client:
+        yield api_client
+
+
+@pytest.fixture(scope="session")
+def async_client(client) -> AsyncApiClient:
+    with AsyncApiClient(client) as api_client:
+        yield api_client
+
+
+@pytest.fixture(scope="session")
+def load_results(pytestconfig) -> dict:
+    return pytestconfig.stash[load_results_key]
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_state(request):
+    yield
+
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").session.cookies.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_cache_marker(request):
+    if request.node.get_closest_marker("no_cache") is None:
+        yield
+        return
+
+    api_client = request.getfixturevalue("client")
+    api_client.bypass_cache = True
+    yield
+    api_client.bypass_cache = False
+
+
+@pytest.fixture(scope="session")
 def weather(client) -> WeatherService:
     return WeatherService(client)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def forecast(client) -> ForecastService:
     return ForecastService(client)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def async_weather(async_client) -> AsyncWeatherService:
+    return AsyncWeatherService(async_client)
+
+
+@pytest.fixture(scope="session")
+def async_forecast(async_client) -> AsyncForecastService:
+    return AsyncForecastService(async_client)
+
+
+@pytest.fixture(scope="session")
 def cities() -> list[str]:
     return load_cities()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def city_locations() -> list[dict]:
+    return load_city_locations()
+
+
+@pytest.fixture(scope="session")
 def weather_schema() -> dict:
-    return load_schema("weather_schema.json")
+    return get_schema("weather_schema.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def forecast_schema() -> dict:
-    return load_schema("forecast_schema.json")
+    return get_schema("forecast_schema.json")
+
+
+@pytest.fixture(scope="session")
+def weather_validator() -> Validator:
+    return get_validator("weather_schema.json")
+
+
+@pytest.fixture(scope="session")
+def forecast_validator() -> Validator:
+    return get_validator("forecast_schema.json")
@@ -8,3 +8,14 @@ DEFAULT_COORDINATES = {"lat": 52.2297, "lon": 21.0122}
 
 INVALID_COORDINATES = {"lat": 12341234, "lon": -98123}
 UNKNOWN_CITY = "Non existing city"
+
+LOAD_TEST_CONCURRENCY = 8
+LOAD_TEST_DURATION_SECONDS = 5.0
+LOAD_TEST_MAX_ERROR_RATE = 0.01
+LOAD_TEST_MIN_THROUGHPUT = 1.0  # requests per second
+LOAD_TEST_LATENCY_BUDGETS = {  # seconds
+    "/weather": {"p50": 0.5, "p95": 1.5, "p99": 3.0, "max": 5.0},
+    "/forecast": {"p50": 0.75, "p95": 2.0, "p99": 4.0, "max": 5.0},
+}
+
+CITY_CHUNK_SIZE = 50
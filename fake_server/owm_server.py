@@ -0,0 +1,294 @@
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from fake_server.payloads import (
+    LocationError,
+    LocationResolver,
+    forecast_payload,
+    load_locations,
+    weather_payload,
+)
+
+API_PREFIX = "/data/2.5"
+ENDPOINTS = (f"{API_PREFIX}/weather", f"{API_PREFIX}/forecast", f"{API_PREFIX}/group")
+DEFAULT_API_KEY = "fake-api-key"
+GROUP_MAX_IDS = 20
+SHUTDOWN_POLL_INTERVAL = 0.05
+DATA_REFRESH_SECONDS = 600
+CACHE_MAX_AGE = 60
+
+INVALID_KEY_MESSAGE = (
+    "Invalid API key. Please see https://openweathermap.org/faq#error401 "
+    "for more info."
+)
+THROTTLED_MESSAGE = (
+    "Your account is temporary blocked due to exceeding of requests limitation "
+    "of your subscription type. Please choose the proper subscription "
+    "https://openweathermap.org/price"
+)
+
+
+class LatencyModel:
+    KINDS = ("none", "fixed", "uniform", "exponential", "lognormal")
+
+    def __init__(self, kind: str = "none", *params: float):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind!r}")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        kind, _, raw_params = spec.partition(":")
+        params = [float(value) for value in raw_params.split(",") if value]
+        return cls(kind, *params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0])
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        return 0.0
+
+
+class Throttle:
+    def __init__(self, requests_per_second: float | None):
+        self.rate = requests_per_second
+        self.tokens = requests_per_second or 0.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if not self.rate:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self.updated) * self.rate
+            self.tokens = min(self.rate, self.tokens + refill)
+            self.updated = now
+
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class FakeOwmServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: str = DEFAULT_API_KEY,
+        latency: LatencyModel | str = "none",
+        error_rate: float = 0.0,
+        requests_per_second: float | None = None,
+        seed: int | None = None,
+        group_endpoint: bool = True,
+    ):
+        if isinstance(latency, str):
+            latency = LatencyModel.parse(latency)
+
+        self.api_key = api_key
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle = Throttle(requests_per_second)
+        self.group_endpoint = group_endpoint
+        self.resolver = LocationResolver(load_locations())
+        self.rng = random.Random(seed)
+        self.requests: Counter[tuple[str, int]] = Counter()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "FakeOwmServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            kwargs={"poll_interval": SHUTDOWN_POLL_INTERVAL},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeOwmServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, path: str, params: dict) -> tuple[int, dict, dict]:
+        with self._lock:
+            delay = self.latency.sample(self.rng)
+            failed = self.rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+
+        if not self.throttle.allow():
+            payload = {"cod": 429, "message": THROTTLED_MESSAGE}
+            return 429, payload, {"Retry-After": "1"}
+        if failed:
+            return 500, {"cod": "500", "message": "Internal error"}, {}
+
+        if path not in ENDPOINTS:
+            return 404, {"cod": "404", "message": "Not found"}, {}
+        if params.get("appid") != self.api_key:
+            return 401, {"cod": 401, "message": INVALID_KEY_MESSAGE}, {}
+
+        now = int(time.time())
+        refreshed = now - now % DATA_REFRESH_SECONDS
+        units = params.get("units")
+        lang = params.get("lang")
+        max_age = min(CACHE_MAX_AGE, refreshed + DATA_REFRESH_SECONDS - now)
+        cache_headers = {
+            "Cache-Control": f"max-age={max_age}",
+            "Last-Modified": formatdate(refreshed, usegmt=True),
+        }
+
+        if path.endswith("/group"):
+            status, payload, headers = self.handle_group(params, refreshed, units, lang)
+            return status, payload, cache_headers if status == 200 else headers
+
+        try:
+            location = self.resolver.resolve(params)
+        except LocationError as exc:
+            return exc.status, {"cod": str(exc.status), "message": exc.message}, {}
+
+        if path.endswith("/weather"):
+            payload = weather_payload(location, refreshed, units, lang)
+        else:
+            payload = forecast_payload(location, refreshed, units, lang)
+        return 200, payload, cache_headers
+
+    def handle_group(
+        self, params: dict, now: int, units: str | None, lang: str | None
+    ) -> tuple[int, dict, dict]:
+        if not self.group_endpoint:
+            return 404, {"cod": "404", "message": "Not found"}, {}
+
+        city_ids = [city_id for city_id in params.get("id", "").split(",") if city_id]
+        if not city_ids:
+            return 400, {"cod": "400", "message": "Nothing to geocode"}, {}
+        if len(city_ids) > GROUP_MAX_IDS:
+            return 400, {"cod": "400", "message": "too many ids"}, {}
+
+        locations = [
+            self.resolver.by_id[city_id]
+            for city_id in city_ids
+            if city_id in self.resolver.by_id
+        ]
+        payload = {
+            "cnt": len(locations),
+            "list": [
+                weather_payload(location, now, units, lang) for location in locations
+            ],
+        }
+        return 200, payload, {}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = dict(parse_qsl(url.query, keep_blank_values=True))
+                status, payload, headers = server.handle(url.path, params)
+                body = json.dumps(payload).encode("utf-8")
+
+                if status == 200:
+                    headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        status, body = 304, b""
+
+                with server._lock:
+                    server.requests[(url.path.removeprefix(API_PREFIX), status)] += 1
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenWeatherMap stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--api-key", default=DEFAULT_API_KEY)
+    parser.add_argument(
+        "--latency",
+        default="none",
+        help="none | fixed:S | uniform:LOW,HIGH | exponential:MEAN "
+        "| lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="answer 429 once this request rate is exceeded",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--no-group-endpoint",
+        action="store_true",
+        help="answer 404 on /group, as for keys without access to it",
+    )
+    args = parser.parse_args()
+
+    server = FakeOwmServer(
+        host=args.host,
+        port=args.port,
+        api_key=args.api_key,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        requests_per_second=args.requests_per_second,
+        seed=args.seed,
+        group_endpoint=not args.no_group_endpoint,
+    )
+    print(f"Fake OpenWeatherMap listening on {server.url} (appid={server.api_key})")
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
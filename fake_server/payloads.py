@@ -0,0 +1,259 @@
+import math
+import random
+import zlib
+from datetime import datetime, timezone
+
+from utils.json_loader import load_json
+
+FORECAST_ENTRIES = 40
+FORECAST_STEP = 3 * 60 * 60
+DIURNAL_AMPLITUDE = 1.5
+NEAREST_CITY_DEGREES = 1.0
+
+CONDITIONS = [
+    (800, "Clear", "clear sky", "01"),
+    (801, "Clouds", "few clouds", "02"),
+    (802, "Clouds", "scattered clouds", "03"),
+    (803, "Clouds", "broken clouds", "04"),
+    (804, "Clouds", "overcast clouds", "04"),
+    (500, "Rain", "light rain", "10"),
+]
+
+TRANSLATIONS = {
+    "pl": {
+        "clear sky": "bezchmurnie",
+        "few clouds": "słabe zachmurzenie",
+        "scattered clouds": "rozproszone chmury",
+        "broken clouds": "zachmurzenie umiarkowane",
+        "overcast clouds": "zachmurzenie duże",
+        "light rain": "słabe opady deszczu",
+    },
+    "de": {
+        "clear sky": "Klarer Himmel",
+        "few clouds": "Ein paar Wolken",
+        "scattered clouds": "Mäßig bewölkt",
+        "broken clouds": "Überwiegend bewölkt",
+        "overcast clouds": "Bedeckt",
+        "light rain": "Leichter Regen",
+    },
+}
+
+
+class LocationError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def load_locations(relative_path: str = "data/city_locations.json") -> list[dict]:
+    return load_json(relative_path)
+
+
+class LocationResolver:
+    def __init__(self, locations: list[dict]):
+        self.locations = locations
+        self.by_name = {}
+        self.by_id = {}
+
+        for location in locations:
+            for name in [location["name"], *location.get("aliases", [])]:
+                self.by_name[name.lower()] = location
+            if location.get("id") is not None:
+                self.by_id[str(location["id"])] = location
+
+    def resolve(self, params: dict) -> dict:
+        if "q" in params:
+            name = params["q"].split(",")[0].strip().lower()
+            if not name:
+                raise LocationError(400, "Nothing to geocode")
+            if name not in self.by_name:
+                raise LocationError(404, "city not found")
+            return self.by_name[name]
+
+        if "id" in params:
+            if params["id"] not in self.by_id:
+                raise LocationError(404, "city not found")
+            return self.by_id[params["id"]]
+
+        if "lat" in params and "lon" in params:
+            return self.resolve_coordinates(params["lat"], params["lon"])
+
+        raise LocationError(400, "Nothing to geocode")
+
+    def resolve_coordinates(self, raw_lat: str, raw_lon: str) -> dict:
+        try:
+            lat = float(raw_lat)
+        except ValueError:
+            raise LocationError(400, f"{raw_lat} is not a float") from None
+        try:
+            lon = float(raw_lon)
+        except ValueError:
+            raise LocationError(400, f"{raw_lon} is not a float") from None
+
+        if not -90 <= lat <= 90:
+            raise LocationError(400, "wrong latitude")
+        if not -180 <= lon <= 180:
+            raise LocationError(400, "wrong longitude")
+
+        nearest = min(
+            self.locations,
+            key=lambda location: (location["lat"] - lat) ** 2
+            + (location["lon"] - lon) ** 2,
+        )
+        distance = math.hypot(nearest["lat"] - lat, nearest["lon"] - lon)
+
+        if distance <= NEAREST_CITY_DEGREES:
+            return {**nearest, "lat": round(lat, 4), "lon": round(lon, 4)}
+
+        return {
+            "id": 0,
+            "name": "",
+            "country": "",
+            "lat": round(lat, 4),
+            "lon": round(lon, 4),
+            "timezone": round(lon / 15) * 3600,
+        }
+
+
+def _seed(location: dict, slot: int) -> int:
+    return zlib.crc32(f"{location['name']}:{slot}".encode())
+
+
+def temperature_kelvin(location: dict, timestamp: int) -> float:
+    base = 300.0 - abs(location["lat"]) * 0.45
+    local_hours = (timestamp + location.get("timezone", 0)) / 3600
+    diurnal = DIURNAL_AMPLITUDE * math.sin(2 * math.pi * (local_hours - 9) / 24)
+    jitter = random.Random(_seed(location, timestamp // 3600)).uniform(-0.1, 0.1)
+    return base + diurnal + jitter
+
+
+def convert_temperature(kelvin: float, units: str | None) -> float:
+    if units == "metric":
+        return round(kelvin - 273.15, 2)
+    if units == "imperial":
+        return round((kelvin - 273.15) * 9 / 5 + 32, 2)
+    return round(kelvin, 2)
+
+
+def convert_wind_speed(meters_per_second: float, units: str | None) -> float:
+    if units == "imperial":
+        return round(meters_per_second * 2.23694, 2)
+    return round(meters_per_second, 2)
+
+
+def _conditions(location: dict, timestamp: int, lang: str | None) -> tuple[dict, int]:
+    rng = random.Random(_seed(location, timestamp // FORECAST_STEP))
+    condition_id, main, description, icon = rng.choice(CONDITIONS)
+    description = TRANSLATIONS.get(lang or "en", {}).get(description, description)
+    local_hour = ((timestamp + location.get("timezone", 0)) // 3600) % 24
+    day = 6 <= local_hour < 18
+
+    weather = {
+        "id": condition_id,
+        "main": main,
+        "description": description,
+        "icon": f"{icon}{'d' if day else 'n'}",
+    }
+    return weather, rng.randint(0, 100)
+
+
+def _main_block(location: dict, timestamp: int, units: str | None) -> dict:
+    kelvin = temperature_kelvin(location, timestamp)
+    rng = random.Random(_seed(location, timestamp // 3600) + 1)
+
+    return {
+        "temp": convert_temperature(kelvin, units),
+        "feels_like": convert_temperature(kelvin - rng.uniform(0, 2), units),
+        "temp_min": convert_temperature(kelvin - rng.uniform(0, 1), units),
+        "temp_max": convert_temperature(kelvin + rng.uniform(0, 1), units),
+        "pressure": rng.randint(995, 1030),
+        "humidity": rng.randint(30, 95),
+        "sea_level": rng.randint(995, 1030),
+        "grnd_level": rng.randint(980, 1020),
+    }
+
+
+def _wind(location: dict, timestamp: int, units: str | None) -> dict:
+    rng = random.Random(_seed(location, timestamp // 3600) + 2)
+    return {
+        "speed": convert_wind_speed(rng.uniform(0, 12), units),
+        "deg": rng.randint(0, 359),
+    }
+
+
+def weather_payload(
+    location: dict, now: int, units: str | None = None, lang: str | None = None
+) -> dict:
+    weather, clouds = _conditions(location, now, lang)
+
+    return {
+        "coord": {"lon": location["lon"], "lat": location["lat"]},
+        "weather": [weather],
+        "base": "stations",
+        "main": _main_block(location, now, units),
+        "visibility": 10000,
+        "wind": _wind(location, now, units),
+        "clouds": {"all": clouds},
+        "dt": now,
+        "sys": {
+            "country": location["country"],
+            "sunrise": now - now % 86400 + 6 * 3600 - location.get("timezone", 0),
+            "sunset": now - now % 86400 + 18 * 3600 - location.get("timezone", 0),
+        },
+        "timezone": location.get("timezone", 0),
+        "id": location.get("id") or 0,
+        "name": location["name"],
+        "cod": 200,
+    }
+
+
+def forecast_entry(
+    location: dict, timestamp: int, units: str | None = None, lang: str | None = None
+) -> dict:
+    weather, clouds = _conditions(location, timestamp, lang)
+    local_hour = ((timestamp + location.get("timezone", 0)) // 3600) % 24
+
+    return {
+        "dt": timestamp,
+        "main": {**_main_block(location, timestamp, units), "temp_kf": 0},
+        "weather": [weather],
+        "clouds": {"all": clouds},
+        "wind": _wind(location, timestamp, units),
+        "visibility": 10000,
+        "pop": round(clouds / 100, 2),
+        "sys": {"pod": "d" if 6 <= local_hour < 18 else "n"},
+        "dt_txt": datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
+    }
+
+
+def forecast_payload(
+    location: dict,
+    now: int,
+    units: str | None = None,
+    lang: str | None = None,
+    count: int = FORECAST_ENTRIES,
+) -> dict:
+    first = now - now % FORECAST_STEP + FORECAST_STEP
+
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": count,
+        "list": [
+            forecast_entry(location, first + i * FORECAST_STEP, units, lang)
+            for i in range(count)
+        ],
+        "city": {
+            "id": location.get("id") or 0,
+            "name": location["name"],
+            "coord": {"lat": location["lat"], "lon": location["lon"]},
+            "country": location["country"],
+            "population": 0,
+            "timezone": location.get("timezone", 0),
+            "sunrise": now - now % 86400 + 6 * 3600 - location.get("timezone", 0),
+            "sunset": now - now % 86400 + 18 * 3600 - location.get("timezone", 0),
+        },
+    }
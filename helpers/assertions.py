@@ -1,5 +1,9 @@
+from typing import Callable, Sequence
+
 import requests
 
+MAX_REPORTED_FAILURES = 10
+
 
 def assert_status_code_and_valid_json(
     response: requests.Response, expected_status: int = 200, expected_type: type = dict
@@ -87,3 +91,137 @@ def assert_coordinates_match(
         f"Difference too big. Expected lon: {expected_lon}, got {actual_lon}\n"
         f"Difference is {lon_difference}, allowed tolerance is {tolerance}"
     )
+
+
+def _failure_message(title: str, failures: list[tuple[int, str]], total: int) -> str:
+    indices = sorted({index for index, _ in failures})
+    details = "\n".join(
+        f"  [{index}] {detail}" for index, detail in failures[:MAX_REPORTED_FAILURES]
+    )
+    hidden = len(failures) - MAX_REPORTED_FAILURES
+
+    return (
+        f"{title}: {len(indices)} of {total} failed at indices {indices}\n"
+        f"{details}" + (f"\n  ... and {hidden} more" if hidden > 0 else "")
+    )
+
+
+def assert_monotonic(values: Sequence[float], name: str = "values"):
+    failures = [
+        (index, f"{name}[{index}]={before} > {name}[{index + 1}]={after}")
+        for index, (before, after) in enumerate(zip(values, values[1:]))
+        if before > after
+    ]
+
+    assert not failures, _failure_message(
+        f"{name} are not sorted", failures, max(len(values) - 1, 0)
+    )
+
+
+def assert_all_within_tolerance(
+    actual: Sequence[float],
+    expected: Sequence[float],
+    tolerance: float,
+    labels: Sequence[str] | None = None,
+):
+    assert len(actual) == len(expected), (
+        f"Length mismatch: {len(actual)} actual vs {len(expected)} expected values"
+    )
+    labels = labels or range(len(actual))
+
+    failures = [
+        (index, f"{label}: expected {exp}, got {act}, difference {abs(act - exp)}")
+        for index, (label, act, exp) in enumerate(zip(labels, actual, expected))
+        if not abs(act - exp) < tolerance
+    ]
+
+    assert not failures, _failure_message(
+        f"Values outside tolerance {tolerance}", failures, len(actual)
+    )
+
+
+def assert_all_coordinates_match(
+    expected: Sequence[tuple[float, float]],
+    actual: Sequence[tuple[float, float]],
+    tolerance: float,
+    labels: Sequence[str] | None = None,
+):
+    assert len(actual) == len(expected), (
+        f"Length mismatch: {len(actual)} actual vs {len(expected)} expected points"
+    )
+    labels = labels or range(len(actual))
+
+    failures = [
+        (
+            index,
+            f"{label}: expected lat/lon {exp_lat}/{exp_lon}, "
+            f"got {act_lat}/{act_lon}",
+        )
+        for index, (label, (exp_lat, exp_lon), (act_lat, act_lon)) in enumerate(
+            zip(labels, expected, actual)
+        )
+        if abs(act_lat - exp_lat) > tolerance or abs(act_lon - exp_lon) > tolerance
+    ]
+
+    assert not failures, _failure_message(
+        f"Coordinates outside tolerance {tolerance}", failures, len(actual)
+    )
+
+
+def assert_converted_series(
+    source: Sequence[float],
+    converted: Sequence[float],
+    convert: Callable[[float], float],
+    tolerance: float,
+):
+    assert_all_within_tolerance(
+        converted, [convert(value) for value in source], tolerance
+    )
+
+
+def assert_forecast_entries_valid(entries: Sequence[dict]):
+    failures = []
+
+    for index, entry in enumerate(entries):
+        missing = [key for key in ("main", "weather", "dt") if key not in entry]
+        if missing:
+            failures.append((index, f"missing keys {missing}"))
+            continue
+
+        temp = entry["main"].get("temp")
+        if isinstance(temp, bool) or not isinstance(temp, (int, float)):
+            failures.append((index, f"temp is not a number: {temp!r}"))
+        if not isinstance(entry["weather"], list) or not entry["weather"]:
+            failures.append((index, f"weather is empty: {entry['weather']!r}"))
+
+    assert not failures, _failure_message(
+        "Invalid forecast entries", failures, len(entries)
+    )
+
+
+def assert_load_within_budget(
+    endpoint: str,
+    stats: dict,
+    latency_budget: dict[str, float],
+    max_error_rate: float,
+    min_throughput: float,
+):
+    violations = [
+        f"{metric} {stats[metric]:.3f}s > {limit:.3f}s"
+        for metric, limit in latency_budget.items()
+        if stats[metric] > limit
+    ]
+
+    if stats["error_rate"] > max_error_rate:
+        violations.append(
+            f"error rate {stats['error_rate']:.2%} > {max_error_rate:.2%}"
+        )
+    if stats["throughput"] < min_throughput:
+        violations.append(
+            f"throughput {stats['throughput']:.2f} req/s < {min_throughput:.2f} req/s"
+        )
+
+    assert not violations, (
+        f"{endpoint} exceeded its load budget: {'; '.join(violations)}\n"
+        f"Stats: {stats}"
+    )
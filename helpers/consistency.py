@@ -0,0 +1,128 @@
+import asyncio
+from typing import Callable
+
+import requests
+from constants import COORDINATES_TOLERANCE, WEATHER_FORECAST_TEMPERATURE_TOLERANCE
+from services.async_forecast_service import AsyncForecastService
+from services.async_weather_service import AsyncWeatherService
+
+Rule = Callable[[dict, dict], str | None]
+
+
+def temperature_rule(tolerance: float = WEATHER_FORECAST_TEMPERATURE_TOLERANCE) -> Rule:
+    def check(weather: dict, forecast: dict) -> str | None:
+        current = weather["main"]["temp"]
+        upcoming = forecast["list"][0]["main"]["temp"]
+        difference = abs(current - upcoming)
+
+        if not difference < tolerance:
+            return (
+                f"current temp {current} vs first forecast temp {upcoming}, "
+                f"difference {difference:.2f} >= {tolerance}"
+            )
+        return None
+
+    return check
+
+
+def coordinates_rule(tolerance: float = COORDINATES_TOLERANCE) -> Rule:
+    def check(weather: dict, forecast: dict) -> str | None:
+        current = weather["coord"]
+        upcoming = forecast["city"]["coord"]
+
+        if (
+            abs(current["lat"] - upcoming["lat"]) > tolerance
+            or abs(current["lon"] - upcoming["lon"]) > tolerance
+        ):
+            return (
+                f"weather coord {current['lat']}/{current['lon']} vs forecast coord "
+                f"{upcoming['lat']}/{upcoming['lon']}, tolerance {tolerance}"
+            )
+        return None
+
+    return check
+
+
+def city_name_rule() -> Rule:
+    def check(weather: dict, forecast: dict) -> str | None:
+        if weather["name"].lower() != forecast["city"]["name"].lower():
+            return (
+                f"weather name {weather['name']!r} vs "
+                f"forecast name {forecast['city']['name']!r}"
+            )
+        return None
+
+    return check
+
+
+def default_rules() -> dict[str, Rule]:
+    return {
+        "temperature": temperature_rule(),
+        "coordinates": coordinates_rule(),
+        "city_name": city_name_rule(),
+    }
+
+
+class ConsistencyReport:
+    def __init__(self, cities: list[str]):
+        self.cities = cities
+        self.violations: list[tuple[str, str, str]] = []
+
+    def add(self, city: str, rule: str, message: str):
+        self.violations.append((city, rule, message))
+
+    def __bool__(self) -> bool:
+        return not self.violations
+
+    def __str__(self) -> str:
+        lines = [
+            f"{len(self.violations)} consistency violations "
+            f"across {len(self.cities)} cities:"
+        ]
+        lines += [
+            f"  {city} [{rule}] {message}" for city, rule, message in self.violations
+        ]
+        return "\n".join(lines)
+
+
+class ConsistencyEngine:
+    def __init__(
+        self,
+        weather: AsyncWeatherService,
+        forecast: AsyncForecastService,
+        rules: dict[str, Rule] | None = None,
+    ):
+        self.weather = weather
+        self.forecast = forecast
+        self.rules = rules if rules is not None else default_rules()
+
+    async def fetch(
+        self, cities: list[str], api_key: str, units: str | None = None
+    ) -> list[tuple[requests.Response, requests.Response]]:
+        weather_responses, forecast_responses = await asyncio.gather(
+            self.weather.get_weather_many(cities, api_key, units=units),
+            self.forecast.get_forecast_many(cities, api_key, units=units),
+        )
+        return list(zip(weather_responses, forecast_responses))
+
+    def run(
+        self, cities: list[str], api_key: str, units: str | None = "metric"
+    ) -> ConsistencyReport:
+        pairs = asyncio.run(self.fetch(cities, api_key, units))
+        report = ConsistencyReport(cities)
+
+        for city, (weather_response, forecast_response) in zip(cities, pairs):
+            statuses = (weather_response.status_code, forecast_response.status_code)
+            if statuses != (200, 200):
+                report.add(city, "status", f"weather/forecast statuses {statuses}")
+                continue
+
+            weather_data = weather_response.json()
+            forecast_data = forecast_response.json()
+
+            for name, rule in self.rules.items():
+                message = rule(weather_data, forecast_data)
+                if message is not None:
+                    report.add(city, name, message)
+
+        return report
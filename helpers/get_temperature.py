@@ -1,6 +1,22 @@
+from array import array
+
+import requests
 from utils.temp_converter import kelvin_to_celsius, kelvin_to_fahrenheit
+from utils.unit_converter import STANDARD, convert_temperature
 from services.weather_service import WeatherService
 from services.forecast_service import ForecastService
+from services.lazy_forecast import LazyForecast
+
+
+def extract_temperature(service: WeatherService | ForecastService, data: dict) -> float:
+    if isinstance(service, WeatherService):
+        return data["main"]["temp"]
+
+    if isinstance(service, ForecastService):
+        return data["list"][0]["main"]["temp"]
+
+    else:
+        raise TypeError("Service must be WeatherService or ForecastService")
 
 
 def get_temperature_for_city(
@@ -10,32 +26,58 @@ def get_temperature_for_city(
     lat: float | None = None,
     lon: float | None = None,
     units: str | None = None,
+    response: requests.Response | None = None,
+    data: dict | None = None,
 ) -> float:
+    if data is None and response is not None:
+        if isinstance(service, ForecastService):
+            return LazyForecast(response).first_entry()["main"]["temp"]
+        data = response.json()
+
+    if data is not None:
+        return extract_temperature(service, data)
+
     if isinstance(service, WeatherService):
         response = service.get_weather(
             city=city, lat=lat, lon=lon, api_key=api_key, units=units
         )
-        return response.json()["main"]["temp"]
+        return extract_temperature(service, response.json())
 
     if isinstance(service, ForecastService):
         response = service.get_forecast(
             city=city, lat=lat, lon=lon, api_key=api_key, units=units
         )
-        return response.json()["list"][0]["main"]["temp"]
+        return LazyForecast(response).first_entry()["main"]["temp"]
 
     else:
         raise TypeError("Service must be WeatherService or ForecastService")
 
 
 def get_temperature_in_celsius(
-    service: WeatherService | ForecastService, api_key: str, city: str
+    service: WeatherService | ForecastService,
+    api_key: str,
+    city: str,
+    data: dict | None = None,
 ) -> float:
-    temp_kelvin = get_temperature_for_city(service, api_key, city)
+    temp_kelvin = get_temperature_for_city(service, api_key, city, data=data)
     return kelvin_to_celsius(temp_kelvin)
 
 
 def get_temperature_in_fahrenheit(
-    service: WeatherService | ForecastService, api_key: str, city: str
+    service: WeatherService | ForecastService,
+    api_key: str,
+    city: str,
+    data: dict | None = None,
 ) -> float:
-    temp_kelvin = get_temperature_for_city(service, api_key, city)
+    temp_kelvin = get_temperature_for_city(service, api_key, city, data=data)
     return kelvin_to_fahrenheit(temp_kelvin)
+
+
+def get_forecast_temperatures(
+    service: ForecastService,
+    api_key: str,
+    city: str,
+    to_units: str = STANDARD,
+) -> array:
+    series = service.get_forecast_model(city, api_key)
+    return convert_temperature(series.temp, STANDARD, to_units)
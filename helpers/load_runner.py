@@ -0,0 +1,123 @@
+import json
+import math
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import requests
+from services.api_client import ApiClient
+from services.tracing import NETWORK, RequestEvent
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(
+    latencies: list[float], errors: int, elapsed: float, requests: int | None = None
+) -> dict:
+    ordered = sorted(latencies)
+    count = len(ordered) if requests is None else requests
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "throughput": count / elapsed if elapsed else 0.0,
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+def run_load(
+    call: Callable[[], requests.Response],
+    concurrency: int,
+    duration: float,
+    expected_status: int = 200,
+    client: ApiClient | None = None,
+) -> dict:
+    latencies: list[float] = []
+    calls = 0
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def record_network(event: RequestEvent):
+        if event.source == NETWORK:
+            with lock:
+                latencies.append(event.total)
+
+    def worker():
+        nonlocal calls, errors
+
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                failed = call().status_code != expected_status
+            except Exception:
+                failed = True
+            latency = time.perf_counter() - start
+
+            with lock:
+                calls += 1
+                errors += failed
+                if client is None:
+                    latencies.append(latency)
+
+    if client is not None:
+        client.observers.append(record_network)
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            workers = [executor.submit(worker) for _ in range(concurrency)]
+            for future in workers:
+                future.result()
+    finally:
+        if client is not None:
+            client.observers.remove(record_network)
+    elapsed = time.perf_counter() - start
+
+    return summarize(latencies, errors, elapsed, requests=calls)
+
+
+def write_report(path: str | Path, results: dict, settings: dict):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {"settings": settings, "endpoints": results}
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", "utf-8")
+
+
+def diff_reports(old_path: str | Path, new_path: str | Path) -> list[str]:
+    old = json.loads(Path(old_path).read_text("utf-8"))["endpoints"]
+    new = json.loads(Path(new_path).read_text("utf-8"))["endpoints"]
+    lines = []
+
+    for endpoint in sorted(set(old) | set(new)):
+        lines.append(endpoint)
+        for metric in ("p50", "p95", "p99", "max", "throughput", "error_rate"):
+            before = old.get(endpoint, {}).get(metric)
+            after = new.get(endpoint, {}).get(metric)
+            if before is None or after is None:
+                lines.append(f"  {metric:<10} {before!s:>10} -> {after!s:>10}")
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            lines.append(
+                f"  {metric:<10} {before:>10.4f} -> {after:>10.4f} ({change:+.1f}%)"
+            )
+
+    return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m helpers.load_runner OLD.json NEW.json")
+    print("\n".join(diff_reports(sys.argv[1], sys.argv[2])))
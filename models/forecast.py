@@ -0,0 +1,95 @@
+import sys
+from array import array
+from typing import Iterable
+
+from models.weather import Coord
+
+
+class ForecastCity:
+    __slots__ = ("city_id", "name", "country", "coord", "timezone")
+
+    def __init__(
+        self,
+        city_id: int | None,
+        name: str,
+        country: str,
+        coord: Coord | None,
+        timezone: int | None,
+    ):
+        self.city_id = city_id
+        self.name = name
+        self.country = country
+        self.coord = coord
+        self.timezone = timezone
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ForecastCity":
+        coord = data.get("coord")
+
+        return cls(
+            city_id=data.get("id"),
+            name=data["name"],
+            country=data["country"],
+            coord=Coord.from_dict(coord) if coord else None,
+            timezone=data.get("timezone"),
+        )
+
+    def __repr__(self) -> str:
+        return f"ForecastCity(name={self.name!r}, country={self.country!r})"
+
+
+class ForecastSeries:
+    __slots__ = (
+        "city",
+        "dt",
+        "temp",
+        "humidity",
+        "pressure",
+        "condition_counts",
+        "descriptions",
+    )
+
+    def __init__(self, city: ForecastCity | None = None):
+        self.city = city
+        self.dt = array("q")
+        self.temp = array("d")
+        self.humidity = array("d")
+        self.pressure = array("d")
+        self.condition_counts = array("H")
+        self.descriptions: list[str] = []
+
+    def append(self, entry: dict):
+        main = entry["main"]
+        conditions = entry["weather"]
+
+        self.dt.append(entry["dt"])
+        self.temp.append(main["temp"])
+        self.humidity.append(main.get("humidity", float("nan")))
+        self.pressure.append(main.get("pressure", float("nan")))
+        self.condition_counts.append(len(conditions))
+        self.descriptions.append(
+            sys.intern(conditions[0]["description"]) if conditions else ""
+        )
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[dict], city: ForecastCity | None = None
+    ) -> "ForecastSeries":
+        series = cls(city)
+        for entry in entries:
+            series.append(entry)
+        return series
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ForecastSeries":
+        return cls.from_entries(data["list"], ForecastCity.from_dict(data["city"]))
+
+    def is_sorted(self) -> bool:
+        dt = self.dt
+        return all(dt[i] <= dt[i + 1] for i in range(len(dt) - 1))
+
+    def __len__(self) -> int:
+        return len(self.dt)
+
+    def __repr__(self) -> str:
+        return f"ForecastSeries(city={self.city!r}, entries={len(self)})"
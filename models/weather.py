@@ -0,0 +1,101 @@
+class Coord:
+    __slots__ = ("lat", "lon")
+
+    def __init__(self, lat: float, lon: float):
+        self.lat = lat
+        self.lon = lon
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Coord":
+        return cls(data["lat"], data["lon"])
+
+    def __repr__(self) -> str:
+        return f"Coord(lat={self.lat}, lon={self.lon})"
+
+
+class Condition:
+    __slots__ = ("id", "main", "description", "icon")
+
+    def __init__(self, id: int, main: str, description: str, icon: str | None):
+        self.id = id
+        self.main = main
+        self.description = description
+        self.icon = icon
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Condition":
+        return cls(data.get("id"), data["main"], data["description"], data.get("icon"))
+
+    def __repr__(self) -> str:
+        return f"Condition(main={self.main!r}, description={self.description!r})"
+
+
+class Weather:
+    __slots__ = (
+        "city_id",
+        "name",
+        "country",
+        "coord",
+        "dt",
+        "timezone",
+        "temp",
+        "feels_like",
+        "pressure",
+        "humidity",
+        "wind_speed",
+        "conditions",
+    )
+
+    def __init__(
+        self,
+        city_id: int | None,
+        name: str,
+        country: str | None,
+        coord: Coord,
+        dt: int | None,
+        timezone: int | None,
+        temp: float,
+        feels_like: float | None,
+        pressure: float,
+        humidity: float,
+        wind_speed: float | None,
+        conditions: tuple[Condition, ...],
+    ):
+        self.city_id = city_id
+        self.name = name
+        self.country = country
+        self.coord = coord
+        self.dt = dt
+        self.timezone = timezone
+        self.temp = temp
+        self.feels_like = feels_like
+        self.pressure = pressure
+        self.humidity = humidity
+        self.wind_speed = wind_speed
+        self.conditions = conditions
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Weather":
+        main = data["main"]
+
+        return cls(
+            city_id=data.get("id"),
+            name=data["name"],
+            country=data.get("sys", {}).get("country"),
+            coord=Coord.from_dict(data["coord"]),
+            dt=data.get("dt"),
+            timezone=data.get("timezone"),
+            temp=float(main["temp"]),
+            feels_like=main.get("feels_like"),
+            pressure=main["pressure"],
+            humidity=main["humidity"],
+            wind_speed=data.get("wind", {}).get("speed"),
+            conditions=tuple(Condition.from_dict(item) for item in data["weather"]),
+        )
+
+    @property
+    def description(self) -> str:
+        return self.conditions[0].description
+
+    def __repr__(self) -> str:
+        return f"Weather(name={self.name!r}, temp={self.temp}, coord={self.coord})"
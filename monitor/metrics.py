@@ -0,0 +1,240 @@
+import threading
+import time
+from bisect import bisect_left
+
+from services.tracing import NETWORK, RequestEvent
+from utils.geo_index import GeoIndex
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+UNKNOWN_PLACE = "unknown"
+
+
+class RollingHistogram:
+    def __init__(
+        self,
+        window: float = 900.0,
+        slots: int = 15,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.buckets = buckets
+        self.slots = slots
+        self.slot_seconds = window / slots
+        self.counts = [[0] * (len(buckets) + 1) for _ in range(slots)]
+        self.sums = [0.0] * slots
+        self.failures = [0] * slots
+        self.epochs = [-1] * slots
+        self.total_counts = [0] * (len(buckets) + 1)
+        self.total_sum = 0.0
+        self.total_failures = 0
+
+    def observe(self, value: float, success: bool, now: float | None = None):
+        epoch = int((time.time() if now is None else now) // self.slot_seconds)
+        slot = epoch % self.slots
+
+        if self.epochs[slot] != epoch:
+            self.epochs[slot] = epoch
+            self.counts[slot] = [0] * (len(self.buckets) + 1)
+            self.sums[slot] = 0.0
+            self.failures[slot] = 0
+
+        bucket = bisect_left(self.buckets, value)
+        self.counts[slot][bucket] += 1
+        self.sums[slot] += value
+        self.failures[slot] += not success
+        self.total_counts[bucket] += 1
+        self.total_sum += value
+        self.total_failures += not success
+
+    def quantile(self, counts: list[int], fraction: float) -> float:
+        count = sum(counts)
+        if not count:
+            return 0.0
+
+        rank = fraction * count
+        seen = 0
+        for bucket, bucket_count in enumerate(counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if bucket == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[bucket - 1] if bucket else 0.0
+                upper = self.buckets[bucket]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+
+        return self.buckets[-1]
+
+    def window(self, now: float | None = None) -> dict:
+        current = int((time.time() if now is None else now) // self.slot_seconds)
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        failures = 0
+
+        for slot, epoch in enumerate(self.epochs):
+            if current - self.slots < epoch <= current:
+                counts = [a + b for a, b in zip(counts, self.counts[slot])]
+                total += self.sums[slot]
+                failures += self.failures[slot]
+
+        count = sum(counts)
+        return {
+            "count": count,
+            "failures": failures,
+            "success_rate": (count - failures) / count if count else None,
+            "mean": total / count if count else 0.0,
+            **{f"p{round(q * 100)}": self.quantile(counts, q) for q in QUANTILES},
+        }
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        running = 0
+        cumulative = []
+
+        for bound, count in zip(bounds, self.total_counts):
+            running += count
+            cumulative.append((bound, running))
+
+        return cumulative
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_label_value(value)}"' for name, value in labels.items())
+
+
+class ProbeMetrics:
+    def __init__(
+        self,
+        geo_index: GeoIndex | None = None,
+        window: float = 900.0,
+        slots: int = 15,
+    ):
+        self.geo_index = geo_index
+        self.window_seconds = window
+        self.slots = slots
+        self.requests: dict[tuple[str, str], RollingHistogram] = {}
+        self.checks: dict[tuple[str, str], RollingHistogram] = {}
+        self.cycles = 0
+        self.last_cycle: dict = {}
+        self._lock = threading.Lock()
+
+    def place(self, params: dict) -> str:
+        place = self.geo_index.resolve(params) if self.geo_index else None
+        return place["name"] if place is not None else UNKNOWN_PLACE
+
+    def _histogram(self, series: dict, key: tuple[str, str]) -> RollingHistogram:
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = RollingHistogram(self.window_seconds, self.slots)
+        return histogram
+
+    def __call__(self, event: RequestEvent):
+        if event.source != NETWORK:
+            return
+
+        success = event.error is None and (event.status or 0) < 500
+        key = (event.endpoint, self.place(event.params))
+        with self._lock:
+            self._histogram(self.requests, key).observe(event.total, success)
+
+    def record_check(self, check: str, city: str, duration: float, passed: bool):
+        with self._lock:
+            self._histogram(self.checks, (check, city)).observe(duration, passed)
+
+    def record_cycle(self, summary: dict):
+        with self._lock:
+            self.cycles += 1
+            self.last_cycle = summary
+
+    def to_dict(self, now: float | None = None) -> dict:
+        now = time.time() if now is None else now
+
+        with self._lock:
+            return {
+                "generated_at": now,
+                "window_seconds": self.window_seconds,
+                "cycles": self.cycles,
+                "last_cycle": self.last_cycle,
+                "requests": [
+                    {
+                        "endpoint": endpoint,
+                        "city": city,
+                        "total": sum(histogram.total_counts),
+                        **histogram.window(now),
+                    }
+                    for (endpoint, city), histogram in sorted(self.requests.items())
+                ],
+                "checks": [
+                    {
+                        "check": check,
+                        "city": city,
+                        "total": sum(histogram.total_counts),
+                        **histogram.window(now),
+                    }
+                    for (check, city), histogram in sorted(self.checks.items())
+                ],
+            }
+
+    def to_prometheus(self, now: float | None = None) -> str:
+        now = time.time() if now is None else now
+
+        with self._lock:
+            lines = [
+                "# TYPE owm_probe_cycles_total counter",
+                f"owm_probe_cycles_total {self.cycles}",
+            ]
+            for prefix, series, label in (
+                ("owm_probe_request", self.requests, "endpoint"),
+                ("owm_probe_check", self.checks, "check"),
+            ):
+                lines += self._prometheus_series(prefix, series, label, now)
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _prometheus_series(
+        prefix: str, series: dict, label: str, now: float
+    ) -> list[str]:
+        duration = f"{prefix}_duration_seconds"
+        families = {
+            f"{duration} histogram": [],
+            f"{prefix}_failures_total counter": [],
+            f"{prefix}_window_duration_seconds gauge": [],
+            f"{prefix}_window_success_ratio gauge": [],
+        }
+        histograms, failures, quantiles, success = families.values()
+
+        for (name, city), histogram in sorted(series.items()):
+            labels = _labels(**{label: name, "city": city})
+            window = histogram.window(now)
+
+            histograms += [
+                f'{duration}_bucket{{{labels},le="{bound}"}} {count}'
+                for bound, count in histogram.cumulative()
+            ]
+            histograms.append(f"{duration}_sum{{{labels}}} {histogram.total_sum}")
+            histograms.append(
+                f"{duration}_count{{{labels}}} {sum(histogram.total_counts)}"
+            )
+            failures.append(
+                f"{prefix}_failures_total{{{labels}}} {histogram.total_failures}"
+            )
+            quantiles += [
+                f"{prefix}_window_duration_seconds{{{labels},quantile=\"{q}\"}} "
+                f"{window[f'p{round(q * 100)}']}"
+                for q in QUANTILES
+            ]
+            if window["success_rate"] is not None:
+                success.append(
+                    f"{prefix}_window_success_ratio{{{labels}}} "
+                    f"{window['success_rate']}"
+                )
+
+        lines = []
+        for family, samples in families.items():
+            lines.append(f"# TYPE {family}")
+            lines += samples
+        return lines
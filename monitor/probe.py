@@ -0,0 +1,447 @@
+import argparse
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib import import_module
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from constants import CITY_CHUNK_SIZE
+from monitor.metrics import ProbeMetrics
+from services.api_client import ApiClient
+from services.async_api_client import AsyncApiClient
+from services.async_forecast_service import AsyncForecastService
+from services.async_weather_service import AsyncWeatherService
+from services.cassette import SECRET_PLACEHOLDER
+from services.forecast_service import ForecastService
+from services.rate_limiter import RateLimiter
+from services.resilience import CircuitBreaker
+from services.weather_service import WeatherService
+from utils.cities_loader import (
+    CITIES_PATH,
+    chunk_cities,
+    iter_cities,
+    load_city_locations,
+    sample_cities,
+)
+from utils.geo_index import GeoIndex
+from utils.schema_registry import get_schema, get_validator
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DOTENV_PATH = ROOT_DIR / ".env"
+CHECK_MODULES = ("tests.test_weather", "tests.test_forecast", "tests.test_auth")
+EXCLUDED_MARKERS = ("performance",)
+CITY_PARAMS = ("city", "city_chunk")
+
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+SKIPPED = "skipped"
+
+
+@dataclass
+class Check:
+    name: str
+    func: Callable
+    kwargs: dict
+    city: str = ""
+    case: str = ""
+
+    @property
+    def id(self) -> str:
+        return f"{self.name}[{self.case}]" if self.case else self.name
+
+
+@dataclass
+class CheckResult:
+    check: Check
+    outcome: str
+    duration: float
+    message: str | None = None
+
+
+@dataclass
+class CycleSummary:
+    started_at: float
+    duration: float = 0.0
+    outcomes: dict[str, int] = field(default_factory=dict)
+    failures: list[dict] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "outcomes": self.outcomes,
+            "failures": self.failures,
+        }
+
+
+def run_check(check: Check) -> CheckResult:
+    start = time.perf_counter()
+
+    try:
+        check.func(**check.kwargs)
+    except pytest.skip.Exception as exc:
+        outcome, message = SKIPPED, str(exc)
+    except AssertionError as exc:
+        outcome, message = FAILED, str(exc) or "assertion failed"
+    except Exception as exc:
+        outcome, message = ERROR, f"{type(exc).__name__}: {exc}"
+    else:
+        outcome, message = PASSED, None
+
+    return CheckResult(check, outcome, time.perf_counter() - start, message)
+
+
+def discover_checks(
+    resources: dict,
+    cities: list[str],
+    modules: tuple[str, ...] = CHECK_MODULES,
+    select: list[str] | None = None,
+) -> tuple[list[Check], list[str]]:
+    checks = []
+    unsupported = []
+
+    for module_name in modules:
+        module = import_module(module_name)
+
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("test_") or func.__module__ != module.__name__:
+                continue
+            if select and not any(pattern in name for pattern in select):
+                continue
+
+            markers = {mark.name: mark for mark in getattr(func, "pytestmark", [])}
+            if any(marker in markers for marker in EXCLUDED_MARKERS):
+                continue
+
+            params = list(inspect.signature(func).parameters)
+            missing = [
+                param
+                for param in params
+                if param not in resources and param not in CITY_PARAMS
+            ]
+            if missing:
+                unsupported.append(f"{module_name}::{name} needs {', '.join(missing)}")
+                continue
+
+            kwargs = {param: resources[param] for param in params if param in resources}
+
+            if "city" in params:
+                checks += [
+                    Check(name, func, {**kwargs, "city": city}, city, city)
+                    for city in cities
+                ]
+            elif "city_chunk" in params:
+                size = markers["cities"].kwargs.get("chunk_size") or CITY_CHUNK_SIZE
+                checks += [
+                    Check(name, func, {**kwargs, "city_chunk": chunk}, case=f"chunk{i}")
+                    for i, chunk in enumerate(chunk_cities(cities, size))
+                ]
+            else:
+                checks.append(Check(name, func, kwargs))
+
+    return checks, unsupported
+
+
+def build_resources(
+    client: ApiClient, async_client: AsyncApiClient, api_key: str, geo_index: GeoIndex
+) -> dict:
+    return {
+        "client": client,
+        "api_key": api_key,
+        "weather": WeatherService(client),
+        "forecast": ForecastService(client),
+        "async_weather": AsyncWeatherService(async_client),
+        "async_forecast": AsyncForecastService(async_client),
+        "city_locations": load_city_locations(),
+        "geo_index": geo_index,
+        "weather_schema": get_schema("weather_schema.json"),
+        "forecast_schema": get_schema("forecast_schema.json"),
+        "weather_validator": get_validator("weather_schema.json"),
+        "forecast_validator": get_validator("forecast_schema.json"),
+    }
+
+
+class Probe:
+    def __init__(
+        self,
+        checks: list[Check],
+        metrics: ProbeMetrics,
+        concurrency: int = 4,
+        interval: float = 60.0,
+        secrets: tuple[str, ...] = (),
+    ):
+        self.checks = checks
+        self.metrics = metrics
+        self.interval = interval
+        self.secrets = tuple(secret for secret in secrets if secret)
+        self.stopped = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="probe"
+        )
+
+    def _redact(self, message: str) -> str:
+        for secret in self.secrets:
+            message = message.replace(secret, SECRET_PLACEHOLDER)
+        return message
+
+    def run_cycle(self) -> tuple[CycleSummary, list[CheckResult]]:
+        summary = CycleSummary(started_at=time.time())
+        start = time.perf_counter()
+        results = list(self._executor.map(run_check, self.checks))
+        summary.duration = time.perf_counter() - start
+
+        for result in results:
+            outcomes = summary.outcomes
+            outcomes[result.outcome] = outcomes.get(result.outcome, 0) + 1
+            if result.outcome == SKIPPED:
+                continue
+
+            check = result.check
+            self.metrics.record_check(
+                check.id, check.city, result.duration, result.outcome == PASSED
+            )
+            if result.outcome != PASSED:
+                summary.failures.append(
+                    {
+                        "check": check.id,
+                        "outcome": result.outcome,
+                        "message": self._redact(result.message.splitlines()[0]),
+                    }
+                )
+
+        self.metrics.record_cycle(summary.to_dict())
+        return summary, results
+
+    def run(self, cycles: int = 0, on_cycle: Callable[[CycleSummary], None] = print):
+        next_run = time.monotonic()
+        completed = 0
+
+        while not self.stopped.is_set():
+            summary, _ = self.run_cycle()
+            on_cycle(summary)
+            completed += 1
+            if cycles and completed >= cycles:
+                return
+
+            next_run += self.interval
+            now = time.monotonic()
+            if next_run < now:
+                next_run += (now - next_run) // self.interval * self.interval
+                next_run += self.interval
+            self.stopped.wait(next_run - now)
+
+    def stop(self):
+        self.stopped.set()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+def write_metrics(path: Path, metrics: ProbeMetrics):
+    if path.suffix == ".prom":
+        text = metrics.to_prometheus()
+    else:
+        text = json.dumps(metrics.to_dict(), indent=2) + "\n"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def serve_metrics(metrics: ProbeMetrics, port: int) -> ThreadingHTTPServer:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = metrics.to_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body = json.dumps(metrics.to_dict()).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def format_summary(number: int, summary: CycleSummary) -> str:
+    outcomes = ", ".join(
+        f"{summary.outcomes.get(outcome, 0)} {outcome}"
+        for outcome in (PASSED, FAILED, ERROR, SKIPPED)
+    )
+    lines = [f"cycle {number}: {outcomes} in {summary.duration:.2f}s"]
+    lines += [
+        f"  {failure['outcome'].upper()} {failure['check']}: {failure['message']}"
+        for failure in summary.failures
+    ]
+    return "\n".join(lines)
+
+
+def load_api_key(fake_server) -> str:
+    if fake_server is not None:
+        return fake_server.api_key
+
+    if DOTENV_PATH.exists():
+        from dotenv import load_dotenv
+
+        load_dotenv(DOTENV_PATH)
+
+    key = os.getenv("API_KEY")
+    if not key:
+        sys.exit("API_KEY is not set")
+    return key
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the weather, forecast and auth checks continuously as a "
+        "synthetic monitoring probe"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=60.0, help="seconds between cycle starts"
+    )
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        default=0,
+        help="stop after this many cycles (0 runs forever)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="checks running at the same time"
+    )
+    parser.add_argument(
+        "-k",
+        "--select",
+        action="append",
+        help="run only checks whose name contains this",
+    )
+    parser.add_argument("--cities-file", default=CITIES_PATH)
+    parser.add_argument(
+        "--cities-sample", type=int, help="check a random sample of this many cities"
+    )
+    parser.add_argument("--cities-seed", type=int)
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=900.0,
+        help="seconds covered by the rolling stats",
+    )
+    parser.add_argument("--window-slots", type=int, default=15)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("reports/probe_metrics.json"),
+        help="file rewritten after each cycle, Prometheus text when it ends in .prom",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, help="serve /metrics and /metrics.json on this port"
+    )
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL"))
+    parser.add_argument(
+        "--calls-per-minute",
+        type=int,
+        default=int(os.getenv("API_CALLS_PER_MINUTE", "60")),
+    )
+    parser.add_argument(
+        "--json-backend", choices=("auto", "stdlib", "orjson"), default="auto"
+    )
+    parser.add_argument("--circuit-breaker-threshold", type=int, default=5)
+    parser.add_argument(
+        "--fake-server",
+        action="store_true",
+        help="probe a local OpenWeatherMap stand-in instead of the real API",
+    )
+    parser.add_argument("--fake-latency", default="none")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    fake_server = None
+
+    if args.fake_server:
+        from fake_server.owm_server import FakeOwmServer
+
+        fake_server = FakeOwmServer(latency=args.fake_latency).start()
+
+    api_key = load_api_key(fake_server)
+    rate_limiter = None
+    if fake_server is None:
+        rate_limiter = RateLimiter(
+            calls_per_minute=args.calls_per_minute,
+            state_path=Path(tempfile.gettempdir()) / "owm-api-rate-limiter.json",
+        )
+
+    geo_index = GeoIndex.load()
+    metrics = ProbeMetrics(geo_index, args.window, args.window_slots)
+    threshold = args.circuit_breaker_threshold
+    client = ApiClient(
+        base_url=fake_server.url if fake_server else args.base_url,
+        pool_size=2 * args.concurrency,
+        rate_limiter=rate_limiter,
+        observers=[metrics],
+        json_backend=args.json_backend,
+        circuit_breaker=CircuitBreaker(threshold) if threshold else None,
+    )
+    async_client = AsyncApiClient(client, args.concurrency)
+
+    cities = list(iter_cities(args.cities_file))
+    if args.cities_sample is not None:
+        cities = sample_cities(cities, args.cities_sample, args.cities_seed)
+
+    resources = build_resources(client, async_client, api_key, geo_index)
+    checks, unsupported = discover_checks(resources, cities, select=args.select)
+    for line in unsupported:
+        print(f"not probed: {line}")
+    print(f"probing {len(checks)} checks every {args.interval:g}s")
+
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = serve_metrics(metrics, args.metrics_port)
+        host, port = metrics_server.server_address[:2]
+        print(f"serving metrics on http://{host}:{port}/metrics")
+    probe = Probe(checks, metrics, args.concurrency, args.interval, (api_key,))
+
+    def on_cycle(summary: CycleSummary):
+        print(format_summary(metrics.cycles, summary), flush=True)
+        write_metrics(args.output, metrics)
+
+    try:
+        probe.run(args.cycles, on_cycle)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        probe.close()
+        async_client.close()
+        client.close()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        if fake_server is not None:
+            fake_server.stop()
+
+
+if __name__ == "__main__":
+    main()
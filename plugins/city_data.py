@@ -0,0 +1,108 @@
+import random
+
+import pytest
+from utils.cities_loader import (
+    CITIES_PATH,
+    chunk_cities,
+    iter_cities,
+    sample_cities,
+    shard_cities,
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("city data")
+    group.addoption(
+        "--cities-file",
+        default=CITIES_PATH,
+        help="city dataset for @pytest.mark.cities tests (.json, .jsonl or .csv)",
+    )
+    group.addoption(
+        "--cities-sample",
+        type=int,
+        default=None,
+        help="run the city tests on a random sample of this many cities",
+    )
+    group.addoption(
+        "--cities-seed",
+        type=int,
+        default=None,
+        help="seed for --cities-sample, for a reproducible sample",
+    )
+    group.addoption(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="run only this shard of the city dataset (0-based)",
+    )
+    group.addoption(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="number of shards the city dataset is split into",
+    )
+
+
+selected_cities_key = pytest.StashKey[list[str]]()
+cities_seed_key = pytest.StashKey[int | None]()
+
+
+def pytest_configure(config):
+    workerinput = getattr(config, "workerinput", None)
+
+    if workerinput is not None:
+        seed = workerinput.get("cities_seed")
+    else:
+        seed = config.getoption("cities_seed")
+        if seed is None and config.getoption("cities_sample") is not None:
+            seed = random.randrange(2**32)
+
+    config.stash[cities_seed_key] = seed
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["cities_seed"] = node.config.stash[cities_seed_key]
+
+
+def pytest_report_header(config):
+    sample_size = config.getoption("cities_sample")
+    if sample_size is not None:
+        seed = config.stash[cities_seed_key]
+        return f"cities sample: {sample_size}, seed: {seed} (--cities-seed {seed})"
+
+
+def selected_cities(config) -> list[str]:
+    cities = shard_cities(
+        iter_cities(config.getoption("cities_file")),
+        config.getoption("shard_index"),
+        config.getoption("shard_count"),
+    )
+
+    sample_size = config.getoption("cities_sample")
+    if sample_size is not None:
+        return sample_cities(cities, sample_size, config.stash[cities_seed_key])
+    return list(cities)
+
+
+def pytest_generate_tests(metafunc):
+    marker = metafunc.definition.get_closest_marker("cities")
+    if marker is None:
+        return
+
+    config = metafunc.config
+    if selected_cities_key not in config.stash:
+        config.stash[selected_cities_key] = selected_cities(config)
+    cities = config.stash[selected_cities_key]
+
+    chunk_size = marker.kwargs.get("chunk_size")
+    if chunk_size is None:
+        metafunc.parametrize("city", cities, ids=cities)
+        return
+
+    chunks = list(chunk_cities(cities, chunk_size))
+    metafunc.parametrize(
+        "city_chunk",
+        chunks,
+        ids=[f"{chunk[0]}..{chunk[-1]}" for chunk in chunks],
+    )
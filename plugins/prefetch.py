@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+from services.tracing import get_current_test, set_current_test
+
+API_KEY = object()
+PREFETCH_TEST_ID = "<prefetch>"
+CACHE_SHARE = 0.75
+TTL_SHARE = 0.5
+
+
+class PrefetchPlan:
+    def __init__(self):
+        self.requests: dict[tuple, tuple[str, dict]] = {}
+        self.declared = 0
+        self.fetched = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def add(self, key: tuple, endpoint: str, params: dict):
+        self.declared += 1
+        self.requests.setdefault(key, (endpoint, params))
+
+    def to_dict(self) -> dict:
+        return {
+            "declared": self.declared,
+            "unique": len(self.requests),
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "skipped": self.skipped,
+        }
+
+
+prefetch_plan_key = pytest.StashKey[PrefetchPlan]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-prefetch",
+        action="store_true",
+        help="do not prefetch the requests declared with @pytest.mark.prefetch",
+    )
+
+
+def pytest_configure(config):
+    config.stash[prefetch_plan_key] = PrefetchPlan()
+
+
+def declared_requests(item, api_key: str | None) -> list[tuple[str, dict]]:
+    if item.get_closest_marker("no_cache") is not None:
+        return []
+
+    callspec = getattr(item, "callspec", None)
+    substitutions = callspec.params if callspec is not None else {}
+    planned = []
+
+    for marker in item.iter_markers("prefetch"):
+        endpoint = marker.args[0]
+        params = {"appid": API_KEY, **marker.kwargs}
+
+        for name, value in params.items():
+            if value is API_KEY:
+                params[name] = api_key
+            elif isinstance(value, str) and "{" in value:
+                params[name] = value.format(**substitutions)
+
+        params = {name: value for name, value in params.items() if value is not None}
+        planned.append((endpoint, params))
+
+    return planned
+
+
+def prefetch_limit(client) -> int:
+    limit = int(client.cache.max_size * CACHE_SHARE)
+
+    if client.rate_limiter is not None:
+        calls = client.rate_limiter.calls_within(client.cache.ttl * TTL_SHARE)
+        limit = min(limit, int(calls))
+
+    return limit
+
+
+async def _fetch_all(async_client, requests: list[tuple[str, dict]]) -> list:
+    return await asyncio.gather(
+        *(async_client.get(endpoint, params=params) for endpoint, params in requests),
+        return_exceptions=True,
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prefetched_requests(request) -> PrefetchPlan:
+    config = request.config
+    plan = config.stash[prefetch_plan_key]
+
+    if config.getoption("no_prefetch"):
+        return plan
+
+    try:
+        api_key = request.getfixturevalue("api_key")
+    except pytest.skip.Exception:
+        return plan
+
+    client = request.getfixturevalue("client")
+    if client.cache is None:
+        return plan
+
+    for item in request.session.items:
+        for endpoint, params in declared_requests(item, api_key):
+            plan.add(client.cache.key(endpoint, params), endpoint, params)
+
+    planned = list(plan.requests.values())
+    limit = prefetch_limit(client)
+    plan.skipped = max(0, len(planned) - limit)
+    planned = planned[:limit]
+
+    if planned:
+        async_client = request.getfixturevalue("async_client")
+        current_test = get_current_test()
+        set_current_test(PREFETCH_TEST_ID)
+        try:
+            results = asyncio.run(_fetch_all(async_client, planned))
+        finally:
+            set_current_test(current_test)
+        plan.failed = sum(isinstance(result, Exception) for result in results)
+        plan.fetched = len(results) - plan.failed
+
+    return plan
+
+
+prefetch_summary_key = pytest.StashKey[dict]()
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    summary = config.stash[prefetch_plan_key].to_dict()
+
+    if hasattr(config, "workerinput"):
+        config.workeroutput["prefetch"] = summary
+        return
+
+    config.stash.setdefault(prefetch_summary_key, summary)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    worker = getattr(node, "workeroutput", {}).get("prefetch")
+    if worker is None:
+        return
+
+    summary = node.config.stash.setdefault(prefetch_summary_key, dict(worker))
+    for name, value in worker.items():
+        summary[name] = max(summary[name], value)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = config.stash.get(prefetch_summary_key, None)
+    if not summary or not summary["declared"]:
+        return
+
+    terminalreporter.write_line(
+        f"prefetch: {summary['declared']} declared requests, "
+        f"{summary['unique']} unique, {summary['fetched']} fetched, "
+        f"{summary['failed']} failed, {summary['skipped']} left to the tests"
+    )
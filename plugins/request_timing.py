@@ -0,0 +1,174 @@
+import json
+import threading
+from collections import defaultdict
+
+import pytest
+from helpers.load_runner import percentile
+from services.tracing import NETWORK, RequestEvent, set_current_test
+
+PHASES = ("connect", "tls", "ttfb", "download")
+SLOWEST_TESTS_SHOWN = 10
+
+
+class RequestTimingCollector:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.endpoints: dict[str, dict] = defaultdict(self._counters)
+        self.tests: dict[str, dict] = defaultdict(self._counters)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _counters() -> dict:
+        return {
+            "calls": 0,
+            "network": 0,
+            "cache_hits": 0,
+            "retries": 0,
+            "hedges": 0,
+            "errors": 0,
+            "new_connections": 0,
+            "total": 0.0,
+            **{phase: 0.0 for phase in PHASES},
+        }
+
+    def __call__(self, event: RequestEvent):
+        test_id = event.test_id or "<outside tests>"
+
+        with self._lock:
+            for counters in (self.endpoints[event.endpoint], self.tests[test_id]):
+                counters["calls"] += 1
+                counters["network"] += event.source == NETWORK
+                counters["cache_hits"] += event.cache_hit
+                counters["retries"] += event.retries
+                counters["hedges"] += event.hedged
+                counters["errors"] += event.error is not None
+                counters["new_connections"] += event.new_connection
+                counters["total"] += event.total
+                for phase in PHASES:
+                    counters[phase] += getattr(event, phase) or 0.0
+
+            if event.source == NETWORK:
+                self.latencies[event.endpoint].append(event.total)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "latencies": {name: list(v) for name, v in self.latencies.items()},
+                "endpoints": {name: dict(c) for name, c in self.endpoints.items()},
+                "tests": {name: dict(c) for name, c in self.tests.items()},
+            }
+
+    def merge(self, data: dict):
+        with self._lock:
+            for endpoint, values in data["latencies"].items():
+                self.latencies[endpoint].extend(values)
+            for target, source in (
+                (self.endpoints, data["endpoints"]),
+                (self.tests, data["tests"]),
+            ):
+                for name, counters in source.items():
+                    for metric, value in counters.items():
+                        target[name][metric] += value
+
+    def endpoint_summary(self) -> dict[str, dict]:
+        summary = {}
+
+        for endpoint, counters in self.endpoints.items():
+            ordered = sorted(self.latencies.get(endpoint, []))
+            network = counters["network"] or 1
+            summary[endpoint] = {
+                **counters,
+                "p50": percentile(ordered, 0.50),
+                "p95": percentile(ordered, 0.95),
+                "max": ordered[-1] if ordered else 0.0,
+                **{f"mean_{phase}": counters[phase] / network for phase in PHASES},
+            }
+
+        return summary
+
+    def report(self) -> dict:
+        return {"endpoints": self.endpoint_summary(), "tests": dict(self.tests)}
+
+
+request_timing_key = pytest.StashKey[RequestTimingCollector]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing-report",
+        default="reports/request_timing.json",
+        help="JSON file the per-test and per-endpoint request timings are written to",
+    )
+
+
+def pytest_configure(config):
+    config.stash[request_timing_key] = RequestTimingCollector()
+
+
+@pytest.fixture(scope="session")
+def request_timing(pytestconfig) -> RequestTimingCollector:
+    return pytestconfig.stash[request_timing_key]
+
+
+def pytest_runtest_setup(item):
+    set_current_test(item.nodeid)
+
+
+def pytest_runtest_teardown(item):
+    set_current_test(None)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    collector = config.stash[request_timing_key]
+
+    if hasattr(config, "workerinput"):
+        config.workeroutput["request_timing"] = collector.to_dict()
+        return
+
+    if collector.endpoints:
+        path = config.rootpath / config.getoption("timing_report")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(collector.report(), indent=2, sort_keys=True))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+
+    if "request_timing" in output:
+        node.config.stash[request_timing_key].merge(output["request_timing"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    collector = config.stash[request_timing_key]
+    if not collector.endpoints:
+        return
+
+    write = terminalreporter.write_line
+    terminalreporter.write_sep("=", "API request timing")
+
+    write(
+        f"{'endpoint':<12}{'calls':>7}{'net':>6}{'cache':>7}{'retry':>7}{'hedge':>7}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}{'conn ms':>9}{'ttfb ms':>9}"
+    )
+    for endpoint, stats in sorted(collector.endpoint_summary().items()):
+        write(
+            f"{endpoint:<12}{stats['calls']:>7}{stats['network']:>6}"
+            f"{stats['cache_hits']:>7}{stats['retries']:>7}{stats['hedges']:>7}"
+            f"{stats['p50'] * 1000:>9.1f}{stats['p95'] * 1000:>9.1f}"
+            f"{stats['max'] * 1000:>9.1f}{stats['mean_connect'] * 1000:>9.1f}"
+            f"{stats['mean_ttfb'] * 1000:>9.1f}"
+        )
+
+    write("")
+    write(f"slowest tests by time spent in API calls (top {SLOWEST_TESTS_SHOWN}):")
+    slowest = sorted(
+        collector.tests.items(), key=lambda item: item[1]["total"], reverse=True
+    )
+    for test_id, stats in slowest[:SLOWEST_TESTS_SHOWN]:
+        write(
+            f"  {stats['total'] * 1000:>9.1f} ms  {stats['calls']:>5} calls "
+            f"({stats['cache_hits']} cached, {stats['retries']} retried, "
+            f"{stats['hedges']} hedged)  {test_id}"
+        )
@@ -1,11 +1,371 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
 import requests
+from services.cassette import RECORD, REPLAY, Cassette
+from services.http_cache import HttpCache
+from services.json_decoding import AUTO, get_decoder, with_decoder
+from services.rate_limiter import RateLimiter
+from services.resilience import (
+    RETRY_STATUSES,
+    CircuitBreaker,
+    HedgePolicy,
+    RetryPolicy,
+)
+from services.response_cache import ResponseCache
+from services.shared_response_cache import SharedResponseCache
+from services.tracing import (
+    CACHE,
+    CASSETTE,
+    HTTP_CACHE,
+    NETWORK,
+    RequestEvent,
+    RequestObserver,
+    TracingAdapter,
+    pop_phase_timings,
+    start_phase_capture,
+)
 
 
 class ApiClient:
     BASE_URL = "https://api.openweathermap.org/data/2.5"
 
+    DEFAULT_TIMEOUT = 10
+    ENDPOINT_TIMEOUTS = {
+        "/weather": 10,
+        "/forecast": 10,
+    }
+
+    RETRY_STATUSES = RETRY_STATUSES
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeouts: dict[str, float] | None = None,
+        cache: ResponseCache | SharedResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cassette: Cassette | None = None,
+        observers: list[RequestObserver] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        http_cache: HttpCache | None = None,
+        json_backend: str = AUTO,
+    ):
+        self.base_url = base_url or self.BASE_URL
+        self.timeouts = {**self.ENDPOINT_TIMEOUTS, **(timeouts or {})}
+        self.cache = cache
+        self.bypass_cache = False
+        self.rate_limiter = rate_limiter
+        self.cassette = cassette
+        self.observers = list(observers or [])
+        self.retry_policy = retry_policy or RetryPolicy(
+            retries, backoff_factor, statuses=self.RETRY_STATUSES
+        )
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self.http_cache = http_cache
+        self.json_decoder = get_decoder(json_backend)
+        self._hedge_pool: ThreadPoolExecutor | None = None
+
+        if hedge is not None:
+            self.observers.append(hedge)
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=2 * pool_size, thread_name_prefix="api-hedge"
+            )
+
+        adapter = TracingAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def get(
-        self, endpoint: str, params: dict | None = None, timeout: int = 10
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        timeout: float | None = None,
+        use_cache: bool = True,
+        stream: bool = False,
     ) -> requests.Response:
-        url = f"{self.BASE_URL}{endpoint}"
-        return requests.get(url, params=params, timeout=timeout)
+        use_cache = use_cache and not self.bypass_cache
+
+        if stream and (
+            self.cassette is not None or use_cache and self.cache is not None
+        ):
+            stream = False
+
+        if stream or not use_cache or self.cache is None:
+            return self._send(endpoint, params, timeout, stream, use_cache)
+
+        key = self.cache.key(endpoint, params)
+
+        with self.cache.lock(key):
+            start = time.perf_counter()
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._emit(
+                    RequestEvent(
+                        endpoint,
+                        params or {},
+                        CACHE,
+                        total=time.perf_counter() - start,
+                        status=cached.status_code,
+                    )
+                )
+                return with_decoder(cached, self.json_decoder)
+
+            response = self._send(endpoint, params, timeout)
+            self.cache.set(key, response)
+
+        return response
+
+    def _send(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: float | None,
+        stream: bool = False,
+        use_http_cache: bool = True,
+    ) -> requests.Response:
+        response = self._fetch(endpoint, params, timeout, stream, use_http_cache)
+        return with_decoder(response, self.json_decoder)
+
+    def _fetch(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: float | None,
+        stream: bool,
+        use_http_cache: bool,
+    ) -> requests.Response:
+        if self.cassette is not None and self.cassette.mode == REPLAY:
+            start = time.perf_counter()
+            response = self.cassette.lookup(endpoint, params)
+            self._emit(
+                RequestEvent(
+                    endpoint,
+                    params or {},
+                    CASSETTE,
+                    total=time.perf_counter() - start,
+                    status=response.status_code,
+                )
+            )
+            return response
+
+        url = f"{self.base_url}{endpoint}"
+
+        if timeout is None:
+            timeout = self.timeouts.get(endpoint, self.DEFAULT_TIMEOUT)
+
+        entry = None
+        if use_http_cache and self.http_cache is not None:
+            start = time.perf_counter()
+            entry = self.http_cache.lookup(url, params)
+            if entry is not None and entry.fresh:
+                response = entry.to_response()
+                self._emit(
+                    RequestEvent(
+                        endpoint,
+                        params or {},
+                        HTTP_CACHE,
+                        total=time.perf_counter() - start,
+                        status=response.status_code,
+                    )
+                )
+                return response
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_call(endpoint)
+
+        headers = entry.conditional_headers() if entry is not None else None
+        succeeded = False
+        try:
+            response = self._send_with_retries(
+                endpoint, url, params, timeout, stream, headers
+            )
+            succeeded = response.status_code < 500
+        finally:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(endpoint, succeeded)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            return self.http_cache.refresh(url, params, entry, response)
+        if use_http_cache and not stream and self.http_cache is not None:
+            self.http_cache.store(url, params, response)
+
+        if not stream and self.cassette is not None and self.cassette.mode == RECORD:
+            self.cassette.record(endpoint, params, response)
+
+        return response
+
+    def _send_with_retries(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict | None,
+        timeout: float,
+        stream: bool,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        attempt = 0
+
+        while True:
+            try:
+                response = self._attempt(
+                    endpoint, url, params, timeout, stream, headers, attempt
+                )
+            except requests.RequestException as exc:
+                if not self.retry_policy.should_retry(attempt, error=exc):
+                    raise
+                time.sleep(self.retry_policy.delay(attempt))
+                attempt += 1
+                continue
+
+            if not self.retry_policy.should_retry(attempt, response):
+                return response
+
+            delay = self.retry_policy.delay(attempt, response)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict | None,
+        timeout: float,
+        stream: bool,
+        headers: dict | None,
+        attempt: int,
+    ) -> requests.Response:
+        hedge_after = None
+        if self.hedge is not None and not stream:
+            hedge_after = self.hedge.delay(endpoint)
+
+        if hedge_after is None:
+            return self._request(
+                endpoint, url, params, timeout, stream, headers, attempt
+            )
+
+        primary = self._hedge_pool.submit(
+            self._request, endpoint, url, params, timeout, stream, headers, attempt
+        )
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        hedged = self._hedge_pool.submit(
+            self._request,
+            endpoint,
+            url,
+            params,
+            timeout,
+            stream,
+            headers,
+            attempt,
+            True,
+        )
+        pending = {primary, hedged}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winners = [future for future in done if future.exception() is None]
+            if winners:
+                for future in [*winners[1:], *pending]:
+                    future.add_done_callback(_close_response)
+                return winners[0].result()
+
+        return primary.result()
+
+    def _request(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict | None,
+        timeout: float,
+        stream: bool,
+        headers: dict | None,
+        attempt: int,
+        hedged: bool = False,
+    ) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        start_phase_capture()
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=timeout, stream=stream
+            )
+        except requests.RequestException as exc:
+            self._emit(
+                RequestEvent(
+                    endpoint,
+                    params or {},
+                    NETWORK,
+                    total=time.perf_counter() - start,
+                    error=type(exc).__name__,
+                    retries=int(attempt > 0),
+                    hedged=hedged,
+                    **pop_phase_timings(),
+                )
+            )
+            raise
+
+        event = self._network_event(endpoint, params, response, start)
+        event.retries = int(attempt > 0)
+        event.hedged = hedged
+        self._emit(event)
+        return response
+
+    def _network_event(
+        self,
+        endpoint: str,
+        params: dict | None,
+        response: requests.Response,
+        start: float,
+    ) -> RequestEvent:
+        total = time.perf_counter() - start
+        phases = pop_phase_timings()
+        headers_received = response.elapsed.total_seconds()
+        setup = phases.get("connect", 0.0) + phases.get("tls", 0.0)
+
+        return RequestEvent(
+            endpoint,
+            params or {},
+            NETWORK,
+            total=total,
+            status=response.status_code,
+            ttfb=max(0.0, headers_received - setup),
+            download=max(0.0, total - headers_received),
+            new_connection="connect" in phases,
+            **phases,
+        )
+
+    def _emit(self, event: RequestEvent):
+        for observer in self.observers:
+            observer(event)
+
+    def close(self):
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _close_response(future: Future):
+    if future.exception() is None:
+        future.result().close()
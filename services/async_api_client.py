@@ -0,0 +1,44 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import requests
+from services.api_client import ApiClient
+
+
+class AsyncApiClient:
+    def __init__(self, client: ApiClient, max_concurrency: int = 10):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="async-api-client"
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def get(
+        self, endpoint: str, params: dict | None = None, **kwargs
+    ) -> requests.Response:
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(self.client.get, endpoint, params, **kwargs)
+            )
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncApiClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
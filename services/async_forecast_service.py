@@ -0,0 +1,32 @@
+import asyncio
+
+import requests
+from services.async_api_client import AsyncApiClient
+from services.forecast_service import ForecastService
+
+
+class AsyncForecastService:
+    def __init__(self, client: AsyncApiClient):
+        self.client = client
+
+    async def get_forecast(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+    ) -> requests.Response:
+        params = ForecastService.build_params(city, api_key, lat, lon, units)
+
+        return await self.client.get("/forecast", params=params)
+
+    async def get_forecast_many(
+        self,
+        cities: list[str],
+        api_key: str | None = None,
+        units: str | None = None,
+    ) -> list[requests.Response]:
+        return await asyncio.gather(
+            *(self.get_forecast(city, api_key, units=units) for city in cities)
+        )
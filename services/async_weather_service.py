@@ -0,0 +1,40 @@
+import asyncio
+
+import requests
+from services.async_api_client import AsyncApiClient
+from services.weather_service import WeatherService
+
+
+class AsyncWeatherService:
+    def __init__(self, client: AsyncApiClient):
+        self.client = client
+
+    async def get_weather(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+        city_id: int | None = None,
+    ) -> requests.Response:
+        params = WeatherService.build_params(
+            city, api_key, lat, lon, units, lang, city_id
+        )
+
+        return await self.client.get("/weather", params=params)
+
+    async def get_weather_many(
+        self,
+        cities: list[str],
+        api_key: str | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+    ) -> list[requests.Response]:
+        return await asyncio.gather(
+            *(
+                self.get_weather(city, api_key, units=units, lang=lang)
+                for city in cities
+            )
+        )
@@ -0,0 +1,115 @@
+import gzip
+import json
+import threading
+from pathlib import Path
+
+import requests
+from services.response_cache import request_key
+from services.serialization import deserialize_response, serialize_response
+from utils.file_lock import FileLock
+from utils.geo_index import GeoIndex
+
+RECORD = "record"
+REPLAY = "replay"
+SECRET_PLACEHOLDER = "<API_KEY>"
+
+
+class CassetteMiss(LookupError):
+    pass
+
+
+class Cassette:
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str,
+        secrets: tuple[str, ...] = (),
+        geo_index: GeoIndex | None = None,
+    ):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.secrets = tuple(secret for secret in secrets if secret)
+        self.geo_index = geo_index
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        if not self.path.exists():
+            if self.mode == REPLAY:
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            return {}
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self):
+        if not self.dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Parallel workers record into the same file, so merge with whatever
+        # another worker has saved since this cassette was loaded.
+        with self._lock, FileLock(self.path.with_name(self.path.name + ".lock")):
+            self._entries = {**self._load(), **self._entries}
+            with gzip.open(self.path, "wt", encoding="utf-8") as f:
+                json.dump(self._entries, f, separators=(",", ":"), sort_keys=True)
+
+        self.dirty = False
+
+    def redact(self, value: str) -> str:
+        for secret in self.secrets:
+            value = value.replace(secret, SECRET_PLACEHOLDER)
+        return value
+
+    def key(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        geo_index: GeoIndex | None = None,
+    ) -> str:
+        redacted = {
+            name: self.redact(str(value)) if value is not None else None
+            for name, value in (params or {}).items()
+        }
+        key = request_key(endpoint, redacted, geo_index)
+        return json.dumps(key, separators=(",", ":"))
+
+    def keys(self, endpoint: str, params: dict | None = None) -> list[str]:
+        keys = [self.key(endpoint, params)]
+        if self.geo_index is not None:
+            place_key = self.key(endpoint, params, self.geo_index)
+            if place_key != keys[0]:
+                keys.insert(0, place_key)
+        return keys
+
+    def lookup(self, endpoint: str, params: dict | None = None) -> requests.Response:
+        keys = self.keys(endpoint, params)
+        entry = next(
+            (self._entries[key] for key in keys if key in self._entries), None
+        )
+
+        if entry is None:
+            raise CassetteMiss(
+                f"No recorded response for {keys[-1]} in {self.path}. "
+                f"Re-run with --record-mode=record to add it."
+            )
+
+        return deserialize_response(entry)
+
+    def record(
+        self, endpoint: str, params: dict | None, response: requests.Response
+    ):
+        entry = serialize_response(response, self.redact)
+
+        with self._lock:
+            for key in self.keys(endpoint, params):
+                self._entries[key] = entry
+            self.dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
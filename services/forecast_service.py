@@ -1,19 +1,21 @@
 import requests
+from models.forecast import ForecastCity, ForecastSeries
 from services.api_client import ApiClient
+from services.lazy_forecast import LazyForecast
 
 
 class ForecastService:
     def __init__(self, client: ApiClient):
         self.client = client
 
-    def get_forecast(
-        self,
+    @staticmethod
+    def build_params(
         city: str | None = None,
         api_key: str | None = None,
         lat: float | None = None,
         lon: float | None = None,
         units: str | None = None,
-    ) -> requests.Response:
+    ) -> dict:
         params = {}
 
         if city is not None:
@@ -27,4 +29,48 @@ class ForecastService:
         if units is not None:
             params["units"] = units
 
+        return params
+
+    def get_forecast(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+    ) -> requests.Response:
+        params = self.build_params(city, api_key, lat, lon, units)
+
         return self.client.get("/forecast", params=params)
+
+    def get_forecast_lazy(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+    ) -> LazyForecast:
+        params = self.build_params(city, api_key, lat, lon, units)
+        response = self.client.get("/forecast", params=params, stream=True)
+
+        return LazyForecast(response)
+
+    def get_forecast_model(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+    ) -> ForecastSeries:
+        forecast = self.get_forecast_lazy(city, api_key, lat, lon, units)
+
+        if forecast.status_code != 200:
+            forecast.close()
+            forecast.response.raise_for_status()
+
+        series = ForecastSeries.from_entries(forecast)
+        series.city = ForecastCity.from_dict(forecast.header["city"])
+
+        return series
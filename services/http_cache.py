@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from services.response_cache import request_key
+from services.serialization import deserialize_response
+
+CACHEABLE_STATUSES = (200,)
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+FRESHNESS_HEADERS = ("Cache-Control", "Expires", *VALIDATOR_HEADERS)
+
+_max_age = re.compile(r"max-age=(\d+)")
+
+
+def _strip_query(url: str) -> str:
+    return url.split("?", 1)[0]
+
+
+def freshness_lifetime(headers, default_ttl: float) -> float | None:
+    cache_control = headers.get("Cache-Control", "").lower()
+
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    match = _max_age.search(cache_control)
+    if match:
+        return float(match.group(1))
+
+    if "Expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, expires - time.time())
+
+    return default_ttl
+
+
+class HttpCacheEntry:
+    __slots__ = ("meta", "body")
+
+    def __init__(self, meta: dict, body: bytes):
+        self.meta = meta
+        self.body = body
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.meta["stored_at"] + self.meta["lifetime"]
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = CaseInsensitiveDict(self.meta["response"]["headers"])
+        conditional = {}
+
+        if "ETag" in headers:
+            conditional["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+
+        return conditional
+
+    def to_response(self) -> requests.Response:
+        response = deserialize_response({**self.meta["response"], "body": {"text": ""}})
+        response._content = self.body
+        return response
+
+
+class HttpCache:
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 0.0,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _path(self, url: str, params: dict | None) -> Path:
+        key = json.dumps(request_key(url, params))
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.http"
+
+    def lookup(self, url: str, params: dict | None) -> HttpCacheEntry | None:
+        path = self._path(url, params)
+
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        entry = HttpCacheEntry(meta, body)
+        if entry.fresh:
+            self.hits += 1
+        return entry
+
+    def store(
+        self, url: str, params: dict | None, response: requests.Response
+    ) -> bool:
+        if response.status_code not in CACHEABLE_STATUSES:
+            return False
+
+        lifetime = freshness_lifetime(response.headers, self.default_ttl)
+        has_validators = any(name in response.headers for name in VALIDATOR_HEADERS)
+        if lifetime is None or (lifetime <= 0 and not has_validators):
+            return False
+
+        meta = {
+            "stored_at": time.time(),
+            "lifetime": lifetime,
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "url": _strip_query(response.url),
+                "elapsed": response.elapsed.total_seconds(),
+            },
+        }
+        self._write(self._path(url, params), meta, response.content)
+        self._evict()
+        return True
+
+    def refresh(
+        self,
+        url: str,
+        params: dict | None,
+        entry: HttpCacheEntry,
+        not_modified: requests.Response,
+    ) -> requests.Response:
+        headers = CaseInsensitiveDict(entry.meta["response"]["headers"])
+        for name in FRESHNESS_HEADERS:
+            if name in not_modified.headers:
+                headers[name] = not_modified.headers[name]
+        entry.meta["response"]["headers"] = dict(headers)
+
+        entry.meta["stored_at"] = time.time()
+        entry.meta["lifetime"] = freshness_lifetime(headers, self.default_ttl) or 0.0
+        self._write(self._path(url, params), entry.meta, entry.body)
+        self.revalidated += 1
+        return entry.to_response()
+
+    def _write(self, path: Path, meta: dict, body: bytes):
+        temp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(temp_path, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8"))
+            f.write(b"\n")
+            f.write(body)
+        os.replace(temp_path, path)
+
+    def _evict(self):
+        entries = []
+        total = 0
+
+        for path in self.directory.glob("*.http"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def size(self) -> int:
+        return sum(path.stat().st_size for path in self.directory.glob("*.http"))
+
+    def clear(self):
+        for path in self.directory.glob("*.http"):
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.http"))
@@ -0,0 +1,54 @@
+import json
+from typing import Any, Callable
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+AUTO = "auto"
+STDLIB = "stdlib"
+ORJSON = "orjson"
+UTF8_ENCODINGS = (None, "utf-8", "utf8")
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def available_backends() -> list[str]:
+    return [STDLIB] + ([ORJSON] if orjson is not None else [])
+
+
+def get_decoder(backend: str = AUTO) -> JsonDecoder:
+    if backend == AUTO:
+        backend = ORJSON if orjson is not None else STDLIB
+
+    if backend == STDLIB:
+        return json.loads
+    if backend == ORJSON:
+        if orjson is None:
+            raise ImportError("The orjson JSON backend is not installed")
+        return orjson.loads
+
+    raise ValueError(f"Unknown JSON backend: {backend!r}")
+
+
+class DecodedResponse(requests.Response):
+    decoder: JsonDecoder = staticmethod(json.loads)
+
+    def json(self, **kwargs) -> Any:
+        encoding = self.encoding.lower() if self.encoding else None
+        if kwargs or encoding not in UTF8_ENCODINGS:
+            return super().json(**kwargs)
+
+        try:
+            return self.decoder(self.content)
+        except ValueError:
+            return super().json()
+
+
+def with_decoder(response: requests.Response, decoder: JsonDecoder) -> DecodedResponse:
+    response.__class__ = DecodedResponse
+    response.decoder = decoder
+    return response
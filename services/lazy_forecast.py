@@ -0,0 +1,142 @@
+import codecs
+import json
+from typing import Iterator
+
+import requests
+
+CHUNK_SIZE = 8192
+WHITESPACE = " \t\r\n"
+
+_decoder = json.JSONDecoder()
+
+
+class _StreamReader:
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        if self.exhausted:
+            return False
+
+        try:
+            chunk = self.text_decoder.decode(next(self.chunks))
+        except StopIteration:
+            chunk = self.text_decoder.decode(b"", final=True)
+            self.exhausted = True
+
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, *chars: str) -> str:
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} in forecast body, got {char!r}"
+            )
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+
+            # A number at the very end of the buffer may continue in the
+            # next chunk, so only trust it once something follows it.
+            if end < len(self.buffer) or not self.fill():
+                self.pos = end
+                return value
+
+
+class LazyForecast:
+    def __init__(self, response: requests.Response, chunk_size: int = CHUNK_SIZE):
+        self.response = response
+        self.header: dict = {}
+        self._chunks = response.iter_content(chunk_size)
+        self._started = False
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    def _parse(self) -> Iterator[dict]:
+        reader = _StreamReader(self._chunks)
+        reader.expect("{")
+
+        if reader.peek() == "}":
+            return
+
+        while True:
+            key = reader.value()
+            reader.expect(":")
+
+            if key == "list":
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",", "]") == "]":
+                            break
+            else:
+                self.header[key] = reader.value()
+
+            if reader.expect(",", "}") == "}":
+                return
+
+    def iter_entries(self) -> Iterator[dict]:
+        if self._started:
+            raise RuntimeError("Forecast body can only be streamed once")
+        self._started = True
+
+        try:
+            yield from self._parse()
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter_entries()
+
+    def first_entry(self) -> dict | None:
+        entries = self.iter_entries()
+        try:
+            return next(entries, None)
+        finally:
+            entries.close()
+
+    def json(self) -> dict:
+        if self._started:
+            raise RuntimeError("Forecast body was already streamed")
+        self._started = True
+
+        try:
+            decoder = getattr(self.response, "decoder", json.loads)
+            return decoder(b"".join(self._chunks))
+        finally:
+            self.close()
+
+    def close(self):
+        for _ in self._chunks:
+            pass
+        self.response.close()
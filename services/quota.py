@@ -0,0 +1,63 @@
+import threading
+from collections import Counter
+
+from services.tracing import NETWORK, RequestEvent
+
+
+def mask_api_key(api_key: str | None) -> str:
+    if not api_key:
+        return "<none>"
+    return repr(api_key[:4] + "***")
+
+
+class QuotaTracker:
+    def __init__(self):
+        self.by_endpoint: Counter[str] = Counter()
+        self.by_test: Counter[str] = Counter()
+        self.by_key: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        if event.source == NETWORK:
+            self.record(event.endpoint, event.params, event.test_id)
+
+    def record(
+        self, endpoint: str, params: dict | None = None, test_id: str | None = None
+    ):
+        api_key = (params or {}).get("appid")
+
+        with self._lock:
+            self.by_endpoint[endpoint] += 1
+            self.by_test[test_id or "<outside tests>"] += 1
+            self.by_key[mask_api_key(api_key)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "by_endpoint": dict(self.by_endpoint),
+            "by_test": dict(self.by_test),
+            "by_key": dict(self.by_key),
+        }
+
+    def merge(self, data: dict):
+        with self._lock:
+            self.by_endpoint.update(data["by_endpoint"])
+            self.by_test.update(data["by_test"])
+            self.by_key.update(data["by_key"])
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_endpoint.values())
+
+    def report_lines(self) -> list[str]:
+        lines = [f"total calls: {self.total}"]
+
+        for title, counter in (
+            ("per endpoint", self.by_endpoint),
+            ("per key", self.by_key),
+            ("per test", self.by_test),
+        ):
+            lines.append(f"{title}:")
+            for name, count in counter.most_common():
+                lines.append(f"  {count:>5}  {name}")
+
+        return lines
@@ -0,0 +1,102 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+from utils.file_lock import FileLock
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class RateLimitExceeded(RuntimeError):
+    pass
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        calls_per_minute: int | None = None,
+        calls_per_day: int | None = None,
+        state_path: str | Path | None = None,
+        max_wait: float = 60.0,
+    ):
+        self.buckets: dict[str, tuple[int, float]] = {}
+
+        if calls_per_minute:
+            self.buckets["minute"] = (
+                calls_per_minute,
+                calls_per_minute / SECONDS_PER_MINUTE,
+            )
+        if calls_per_day:
+            self.buckets["day"] = (calls_per_day, calls_per_day / SECONDS_PER_DAY)
+
+        self.max_wait = max_wait
+        self.state_path = Path(state_path) if state_path is not None else None
+        self._file_lock = (
+            FileLock(self.state_path.with_suffix(".lock")) if self.state_path else None
+        )
+        self._thread_lock = threading.Lock()
+        self._state: dict = {}
+
+    def calls_within(self, seconds: float) -> float:
+        if not self.buckets:
+            return float("inf")
+        return min(
+            capacity + rate * seconds for capacity, rate in self.buckets.values()
+        )
+
+    def acquire(self):
+        if not self.buckets:
+            return
+
+        while True:
+            wait = self._try_consume()
+            if wait == 0:
+                return
+            if wait > self.max_wait:
+                raise RateLimitExceeded(
+                    f"API rate limit reached, next call allowed in {wait:.0f}s "
+                    f"(max wait is {self.max_wait:.0f}s)"
+                )
+            time.sleep(wait)
+
+    def _try_consume(self) -> float:
+        lock = self._file_lock or self._thread_lock
+
+        with lock:
+            state = self._load_state()
+            now = time.time()
+            wait = 0.0
+
+            for name, (capacity, rate) in self.buckets.items():
+                bucket = state.get(name, {"tokens": capacity, "updated": now})
+                elapsed = max(0.0, now - bucket["updated"])
+                tokens = min(capacity, bucket["tokens"] + elapsed * rate)
+                state[name] = {"tokens": tokens, "updated": now}
+
+                if tokens < 1:
+                    wait = max(wait, (1 - tokens) / rate)
+
+            if wait == 0:
+                for name in self.buckets:
+                    state[name]["tokens"] -= 1
+
+            self._save_state(state)
+            return wait
+
+    def _load_state(self) -> dict:
+        if self.state_path is None:
+            return self._state
+
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_state(self, state: dict):
+        if self.state_path is None:
+            self._state = state
+            return
+
+        self.state_path.write_text(json.dumps(state), encoding="utf-8")
@@ -0,0 +1,158 @@
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from email.utils import parsedate_to_datetime
+
+import requests
+from services.tracing import NETWORK, RequestEvent
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpen(RuntimeError):
+    pass
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        statuses: tuple[int, ...] = RETRY_STATUSES,
+        seed: int | None = None,
+    ):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.rng = random.Random(seed)
+
+    def should_retry(
+        self,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        if attempt >= self.retries:
+            return False
+        if error is not None:
+            return isinstance(error, RETRY_ERRORS)
+        return response is not None and response.status_code in self.statuses
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        if response is not None:
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        ceiling = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return self.rng.uniform(0, ceiling)
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+    ):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.samples: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        if event.source != NETWORK or event.error is not None or event.hedged:
+            return
+
+        with self._lock:
+            self.samples[event.endpoint].append(event.total)
+
+    def delay(self, endpoint: str) -> float | None:
+        with self._lock:
+            samples = sorted(self.samples.get(endpoint, ()))
+
+        if len(samples) < self.min_samples:
+            return None
+
+        index = min(len(samples) - 1, int(self.quantile * len(samples)))
+        return max(self.min_delay, samples[index])
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures: dict[str, int] = defaultdict(int)
+        self.opened_at: dict[str, float] = {}
+        self._trial_running: set[str] = set()
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> str:
+        opened_at = self.opened_at.get(endpoint)
+        if opened_at is None:
+            return CLOSED
+        if time.monotonic() - opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def before_call(self, endpoint: str):
+        with self._lock:
+            state = self.state(endpoint)
+
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and endpoint not in self._trial_running:
+                self._trial_running.add(endpoint)
+                return
+
+            remaining = self.reset_timeout - (
+                time.monotonic() - self.opened_at[endpoint]
+            )
+            raise CircuitOpen(
+                f"Circuit for {endpoint} is open after {self.failures[endpoint]} "
+                f"consecutive failures, next trial in {max(0.0, remaining):.1f}s"
+            )
+
+    def record(self, endpoint: str, success: bool):
+        with self._lock:
+            self._trial_running.discard(endpoint)
+
+            if success:
+                self.failures.pop(endpoint, None)
+                self.opened_at.pop(endpoint, None)
+                return
+
+            self.failures[endpoint] += 1
+            if (
+                endpoint in self.opened_at
+                or self.failures[endpoint] >= self.failure_threshold
+            ):
+                self.opened_at[endpoint] = time.monotonic()
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from utils.geo_index import LOCATION_PARAMS, GeoIndex, place_key
+
+CASE_INSENSITIVE_PARAMS = ("q", "units", "lang")
+UNCACHEABLE_STATUSES = (429, 500, 502, 503, 504)
+KEY_LOCK_STRIPES = 256
+LEARNED_ENDPOINTS = ("/weather",)
+
+
+def request_key(
+    endpoint: str, params: dict | None = None, geo_index: GeoIndex | None = None
+) -> tuple:
+    normalized = []
+    place = geo_index.resolve(params or {}) if geo_index is not None else None
+
+    if place is not None:
+        normalized.append(("place", place_key(place)))
+
+    for name, value in (params or {}).items():
+        if value is None or (place is not None and name in LOCATION_PARAMS):
+            continue
+        value = str(value)
+        if name in CASE_INSENSITIVE_PARAMS:
+            value = value.lower()
+        normalized.append((name, value))
+
+    return (endpoint, tuple(sorted(normalized)))
+
+
+def learn_location(
+    geo_index: GeoIndex | None, key: tuple, response: requests.Response
+):
+    endpoint, normalized = key
+    if geo_index is None or response.status_code != 200:
+        return
+    if endpoint not in LEARNED_ENDPOINTS or any(
+        name == "place" for name, _ in normalized
+    ):
+        return
+
+    try:
+        geo_index.add_response(response.json())
+    except ValueError:
+        pass
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 300.0,
+        geo_index: GeoIndex | None = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.geo_index = geo_index
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, requests.Response]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+
+    def key(self, endpoint: str, params: dict | None = None) -> tuple:
+        return request_key(endpoint, params, self.geo_index)
+
+    def lock(self, key: tuple) -> threading.Lock:
+        return self._key_locks[hash(key) % KEY_LOCK_STRIPES]
+
+    def get(self, key: tuple) -> requests.Response | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, response: requests.Response):
+        if response.status_code in UNCACHEABLE_STATUSES:
+            return
+
+        learn_location(self.geo_index, key, response)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
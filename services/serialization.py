@@ -0,0 +1,47 @@
+import base64
+from datetime import timedelta
+from typing import Callable
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+def serialize_response(
+    response: requests.Response, redact: Callable[[str], str] = str
+) -> dict:
+    content = response.content
+
+    try:
+        body = {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        body = {"base64": base64.b64encode(content).decode("ascii")}
+
+    return {
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": dict(response.headers),
+        "url": redact(response.url),
+        "elapsed": response.elapsed.total_seconds(),
+        "body": body,
+    }
+
+
+def deserialize_response(entry: dict) -> requests.Response:
+    body = entry["body"]
+
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = entry["reason"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.url = entry["url"]
+    response.elapsed = timedelta(seconds=entry["elapsed"])
+    response.encoding = get_encoding_from_headers(response.headers)
+
+    if "base64" in body:
+        response._content = base64.b64decode(body["base64"])
+    else:
+        response._content = body["text"].encode("utf-8")
+    response._content_consumed = True
+
+    return response
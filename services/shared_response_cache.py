@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import requests
+from services.response_cache import UNCACHEABLE_STATUSES, learn_location, request_key
+from services.serialization import deserialize_response, serialize_response
+from utils.file_lock import FileLock
+from utils.geo_index import GeoIndex
+
+
+class SharedResponseCache:
+    def __init__(
+        self,
+        directory: str | Path,
+        max_size: int = 256,
+        ttl: float = 300.0,
+        geo_index: GeoIndex | None = None,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.geo_index = geo_index
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: tuple) -> Path:
+        digest = hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def key(self, endpoint: str, params: dict | None = None) -> tuple:
+        return request_key(endpoint, params, self.geo_index)
+
+    def lock(self, key: tuple) -> FileLock:
+        return FileLock(self._path(key).with_suffix(".lock"))
+
+    def get(self, key: tuple) -> requests.Response | None:
+        path = self._path(key)
+
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+
+        if entry["expires"] < time.time():
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        return deserialize_response(entry["response"])
+
+    def set(self, key: tuple, response: requests.Response):
+        if response.status_code in UNCACHEABLE_STATUSES:
+            return
+
+        learn_location(self.geo_index, key, response)
+
+        path = self._path(key)
+        entry = {
+            "expires": time.time() + self.ttl,
+            "response": serialize_response(response),
+        }
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(temp_path, path)
+
+        self._evict()
+
+    def _evict(self):
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_size:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_size]:
+            entry.unlink(missing_ok=True)
+            entry.with_suffix(".lock").unlink(missing_ok=True)
+
+    def clear(self):
+        for entry in self.directory.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
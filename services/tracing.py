@@ -0,0 +1,107 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+NETWORK = "network"
+CACHE = "cache"
+CASSETTE = "cassette"
+HTTP_CACHE = "http-cache"
+
+_context = threading.local()
+_current_test: str | None = None
+
+
+def set_current_test(test_id: str | None):
+    global _current_test
+    _current_test = test_id
+
+
+def get_current_test() -> str | None:
+    return _current_test
+
+
+@dataclass
+class RequestEvent:
+    endpoint: str
+    params: dict
+    source: str
+    total: float
+    status: int | None = None
+    test_id: str | None = field(default_factory=get_current_test)
+    connect: float | None = None
+    tls: float | None = None
+    ttfb: float | None = None
+    download: float | None = None
+    new_connection: bool = False
+    retries: int = 0
+    hedged: bool = False
+    error: str | None = None
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.source in (CACHE, HTTP_CACHE)
+
+
+RequestObserver = Callable[[RequestEvent], None]
+
+
+def start_phase_capture():
+    _context.phases = {}
+
+
+def pop_phase_timings() -> dict[str, float]:
+    phases = getattr(_context, "phases", None) or {}
+    _context.phases = None
+    return phases
+
+
+def _record_phase(name: str, seconds: float):
+    phases = getattr(_context, "phases", None)
+    if phases is not None:
+        phases[name] = phases.get(name, 0.0) + seconds
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        _record_phase("connect", time.perf_counter() - start)
+        return sock
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        _record_phase("connect", time.perf_counter() - start)
+        return sock
+
+    def connect(self):
+        phases = getattr(_context, "phases", None) or {}
+        connect_before = phases.get("connect", 0.0)
+        start = time.perf_counter()
+        super().connect()
+        connect = (getattr(_context, "phases", None) or {}).get("connect", 0.0)
+        _record_phase("tls", time.perf_counter() - start - (connect - connect_before))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TracingAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
@@ -1,13 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from models.weather import Weather
 from services.api_client import ApiClient
 
+GROUP_MAX_IDS = 20
+FALLBACK_CONCURRENCY = 10
+
 
 class WeatherService:
     def __init__(self, client: ApiClient):
         self.client = client
 
-    def get_weather(
-        self,
+    @staticmethod
+    def build_params(
         city: str | None = None,
         api_key: str | None = None,
         lat: float | None = None,
@@ -15,7 +21,7 @@ class WeatherService:
         units: str | None = None,
         lang: str | None = None,
         city_id: int | None = None,
-    ) -> requests.Response:
+    ) -> dict:
         params = {}
 
         if city is not None:
@@ -33,4 +39,83 @@ class WeatherService:
         if city_id is not None:
             params["id"] = city_id
 
+        return params
+
+    def get_weather(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+        city_id: int | None = None,
+    ) -> requests.Response:
+        params = self.build_params(city, api_key, lat, lon, units, lang, city_id)
+
         return self.client.get("/weather", params=params)
+
+    def get_weather_model(
+        self,
+        city: str | None = None,
+        api_key: str | None = None,
+        lat: float | None = None,
+        lon: float | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+        city_id: int | None = None,
+    ) -> Weather:
+        response = self.get_weather(city, api_key, lat, lon, units, lang, city_id)
+        response.raise_for_status()
+
+        return Weather.from_dict(response.json())
+
+    def get_weather_group(
+        self,
+        city_ids: list[int],
+        api_key: str | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+    ) -> requests.Response:
+        params = self.build_params(api_key=api_key, units=units, lang=lang)
+        params["id"] = ",".join(str(city_id) for city_id in city_ids)
+
+        return self.client.get("/group", params=params)
+
+    def get_weather_bulk(
+        self,
+        city_ids: list[int],
+        api_key: str | None = None,
+        units: str | None = None,
+        lang: str | None = None,
+        key: str = "id",
+    ) -> dict[int | str, dict]:
+        city_ids = list(dict.fromkeys(city_ids))
+        results = {}
+        missing = []
+
+        for start in range(0, len(city_ids), GROUP_MAX_IDS):
+            chunk = city_ids[start : start + GROUP_MAX_IDS]
+            response = self.get_weather_group(chunk, api_key, units, lang)
+
+            if response.status_code != 200:
+                missing.extend(chunk)
+                continue
+
+            for data in response.json()["list"]:
+                results[data[key]] = data
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=FALLBACK_CONCURRENCY) as executor:
+                responses = executor.map(
+                    lambda city_id: self.get_weather(
+                        api_key=api_key, units=units, lang=lang, city_id=city_id
+                    ),
+                    missing,
+                )
+                for response in responses:
+                    if response.status_code == 200:
+                        data = response.json()
+                        results[data[key]] = data
+
+        return results
@@ -8,6 +8,7 @@ import pytest
 
 
 @pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
 def test_auth_valid_key(weather, api_key):
     city = DEFAULT_CITY
 
@@ -18,6 +19,7 @@ def test_auth_valid_key(weather, api_key):
 
 
 @pytest.mark.negative
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY, appid="11111")
 def test_auth_invalid_key(weather):
     city = DEFAULT_CITY
     error_substring = "invalid"
@@ -29,6 +31,7 @@ def test_auth_invalid_key(weather):
 
 
 @pytest.mark.negative
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY, appid=None)
 def test_auth_no_key_provided(weather):
     city = DEFAULT_CITY
     error_substring = "invalid"
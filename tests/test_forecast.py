@@ -1,12 +1,19 @@
-from jsonschema import validate
 from constants import TEMPERATURE_CONVERSION_TOLERANCE, DEFAULT_CITY, UNKNOWN_CITY
 from helpers.assertions import (
+    assert_all_within_tolerance,
+    assert_converted_series,
     assert_error_message_present,
+    assert_forecast_entries_valid,
+    assert_monotonic,
     assert_status_code_and_valid_json,
     assert_within_tolerance,
     assert_error_message,
 )
-from helpers.get_temperature import get_temperature_for_city, get_temperature_in_celsius
+from helpers.get_temperature import (
+    get_forecast_temperatures,
+    get_temperature_for_city,
+    get_temperature_in_celsius,
+)
 from utils.temp_converter import kelvin_to_celsius
 import pytest
 
@@ -35,34 +42,47 @@ def test_forecast_returns_5_day_forecast_for_city(forecast, api_key):
     assert isinstance(data["list"], list)
     assert len(data["list"]) >= 30
 
-    timestamps = [item["dt"] for item in data["list"]]
-    assert timestamps == sorted(timestamps)
+    assert_forecast_entries_valid(data["list"])
+    assert_monotonic([item["dt"] for item in data["list"]], name="timestamps")
 
-    for entry in data["list"]:
-        assert "main" in entry
-        assert "weather" in entry
-        assert "dt" in entry
+    assert data["city"]["name"] == city
 
-        temp = entry["main"]["temp"]
-        assert isinstance(temp, (int, float))
 
-        assert isinstance(entry["weather"], list)
-        assert len(entry["weather"]) > 0
+@pytest.mark.forecast
+@pytest.mark.positive
+def test_forecast_streamed_entries_match_full_body(forecast, api_key):
+    city = DEFAULT_CITY
 
-    assert data["city"]["name"] == city
+    data = assert_status_code_and_valid_json(forecast.get_forecast(city, api_key))
+    lazy_forecast = forecast.get_forecast_lazy(city, api_key)
+
+    assert lazy_forecast.status_code == 200
+    assert list(lazy_forecast) == data["list"]
+    assert lazy_forecast.header["city"] == data["city"]
+
+
+@pytest.mark.forecast
+@pytest.mark.positive
+def test_forecast_model_has_sorted_series_for_city(forecast, api_key):
+    city = DEFAULT_CITY
+
+    series = forecast.get_forecast_model(city, api_key)
+
+    assert len(series) >= 30
+    assert series.is_sorted()
+    assert min(series.condition_counts) > 0
+    assert series.city.name == city
 
 
 @pytest.mark.forecast
 @pytest.mark.positive
-def test_forecast_response_matches_schema(forecast, api_key, forecast_schema):
+def test_forecast_response_matches_schema(forecast, api_key, forecast_validator):
     city = DEFAULT_CITY
 
     response = forecast.get_forecast(city, api_key)
 
     data = assert_status_code_and_valid_json(response)
-    schema = forecast_schema
-
-    validate(instance=data, schema=schema)
+    forecast_validator.validate(data)
 
 
 @pytest.mark.forecast
@@ -87,14 +107,50 @@ def test_forecast_returns_temperature_in_celsius_when_units_metric(forecast, api
     response_kelvin = forecast.get_forecast(city, api_key)
     response_celsius = forecast.get_forecast(city, api_key, units="metric")
 
-    assert_status_code_and_valid_json(response_kelvin)
+    data_kelvin = assert_status_code_and_valid_json(response_kelvin)
     assert_status_code_and_valid_json(response_celsius)
 
-    temp_kelvin = get_temperature_for_city(forecast, api_key, city)
-    temp_celsius = get_temperature_in_celsius(forecast, api_key, city)
+    temp_kelvin = get_temperature_for_city(forecast, api_key, city, data=data_kelvin)
+    temp_celsius = get_temperature_in_celsius(forecast, api_key, city, data=data_kelvin)
 
     temp_converted = kelvin_to_celsius(temp_kelvin)
 
     assert_within_tolerance(
         temp_celsius, temp_converted, TEMPERATURE_CONVERSION_TOLERANCE
     )
+
+
+@pytest.mark.forecast
+@pytest.mark.positive
+def test_forecast_converts_every_entry_when_units_metric(forecast, api_key):
+    city = DEFAULT_CITY
+
+    response_kelvin = forecast.get_forecast(city, api_key)
+    response_celsius = forecast.get_forecast(city, api_key, units="metric")
+
+    data_kelvin = assert_status_code_and_valid_json(response_kelvin)
+    data_celsius = assert_status_code_and_valid_json(response_celsius)
+
+    assert_converted_series(
+        [entry["main"]["temp"] for entry in data_kelvin["list"]],
+        [entry["main"]["temp"] for entry in data_celsius["list"]],
+        kelvin_to_celsius,
+        TEMPERATURE_CONVERSION_TOLERANCE,
+    )
+
+
+@pytest.mark.forecast
+@pytest.mark.positive
+def test_forecast_series_converts_to_metric_in_one_call(forecast, api_key):
+    city = DEFAULT_CITY
+
+    temps_celsius = get_forecast_temperatures(forecast, api_key, city, "metric")
+
+    response_celsius = forecast.get_forecast(city, api_key, units="metric")
+    data_celsius = assert_status_code_and_valid_json(response_celsius)
+
+    assert_all_within_tolerance(
+        temps_celsius,
+        [entry["main"]["temp"] for entry in data_celsius["list"]],
+        TEMPERATURE_CONVERSION_TOLERANCE,
+    )
@@ -1,5 +1,6 @@
 from constants import DEFAULT_CITY, WEATHER_FORECAST_TEMPERATURE_TOLERANCE
 from helpers.get_temperature import get_temperature_for_city
+from helpers.consistency import ConsistencyEngine
 from helpers.assertions import (
     assert_within_tolerance,
     assert_status_code_and_valid_json,
@@ -15,10 +16,30 @@ def test_weather_and_forecast_return_consistent_temperature(weather, forecast, a
     weather_response = weather.get_weather(city, api_key, units="metric")
     forecast_response = forecast.get_forecast(city, api_key, units="metric")
 
-    assert_status_code_and_valid_json(weather_response)
-    assert_status_code_and_valid_json(forecast_response)
+    weather_data = assert_status_code_and_valid_json(weather_response)
+    forecast_data = assert_status_code_and_valid_json(forecast_response)
 
-    current_temp = get_temperature_for_city(weather, api_key, city)
-    forecast_temp = get_temperature_for_city(forecast, api_key, city)
+    current_temp = get_temperature_for_city(weather, api_key, city, data=weather_data)
+    forecast_temp = get_temperature_for_city(
+        forecast, api_key, city, data=forecast_data
+    )
 
     assert_within_tolerance(current_temp, forecast_temp, tolerance)
+
+
+@pytest.mark.integration
+@pytest.mark.no_cache
+def test_weather_and_forecast_are_consistent_for_all_cities(
+    async_weather, async_forecast, api_key, cities, request_timing, request
+):
+    engine = ConsistencyEngine(async_weather, async_forecast)
+
+    report = engine.run(cities, api_key, units="metric")
+
+    assert report, str(report)
+
+    counters = request_timing.tests[request.node.nodeid]
+    calls = counters["calls"] - counters["retries"] - counters["hedges"]
+    assert calls == 2 * len(cities), (
+        f"Expected {2 * len(cities)} requests for {len(cities)} cities, got {calls}"
+    )
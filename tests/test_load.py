@@ -0,0 +1,61 @@
+from constants import (
+    DEFAULT_CITY,
+    LOAD_TEST_LATENCY_BUDGETS,
+    LOAD_TEST_MAX_ERROR_RATE,
+    LOAD_TEST_MIN_THROUGHPUT,
+)
+from helpers.assertions import assert_load_within_budget
+from helpers.load_runner import run_load
+import pytest
+
+
+@pytest.mark.performance
+@pytest.mark.load
+@pytest.mark.no_cache
+@pytest.mark.weather
+def test_weather_endpoint_under_load(
+    weather, client, api_key, pytestconfig, load_results
+):
+    endpoint = "/weather"
+
+    stats = run_load(
+        lambda: weather.get_weather(DEFAULT_CITY, api_key),
+        concurrency=pytestconfig.getoption("load_concurrency"),
+        duration=pytestconfig.getoption("load_duration"),
+        client=client,
+    )
+    load_results[endpoint] = stats
+
+    assert_load_within_budget(
+        endpoint,
+        stats,
+        LOAD_TEST_LATENCY_BUDGETS[endpoint],
+        LOAD_TEST_MAX_ERROR_RATE,
+        LOAD_TEST_MIN_THROUGHPUT,
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.load
+@pytest.mark.no_cache
+@pytest.mark.forecast
+def test_forecast_endpoint_under_load(
+    forecast, client, api_key, pytestconfig, load_results
+):
+    endpoint = "/forecast"
+
+    stats = run_load(
+        lambda: forecast.get_forecast(DEFAULT_CITY, api_key),
+        concurrency=pytestconfig.getoption("load_concurrency"),
+        duration=pytestconfig.getoption("load_duration"),
+        client=client,
+    )
+    load_results[endpoint] = stats
+
+    assert_load_within_budget(
+        endpoint,
+        stats,
+        LOAD_TEST_LATENCY_BUDGETS[endpoint],
+        LOAD_TEST_MAX_ERROR_RATE,
+        LOAD_TEST_MIN_THROUGHPUT,
+    )
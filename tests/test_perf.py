@@ -4,6 +4,7 @@ import pytest
 
 @pytest.mark.performance
 @pytest.mark.positive
+@pytest.mark.no_cache
 def test_weather_endpoint_response_time(weather, api_key):
     city = DEFAULT_CITY
     max_seconds = 5.0
@@ -0,0 +1,116 @@
+import threading
+
+from constants import DEFAULT_CITY
+from fake_server.owm_server import FakeOwmServer, LatencyModel
+from services.api_client import ApiClient
+from services.resilience import (
+    OPEN,
+    CircuitBreaker,
+    CircuitOpen,
+    HedgePolicy,
+    RetryPolicy,
+)
+from services.weather_service import WeatherService
+import pytest
+
+
+def counters_for(request_timing, request) -> dict:
+    return request_timing.tests[request.node.nodeid]
+
+
+@pytest.mark.resilience
+@pytest.mark.negative
+def test_server_errors_are_retried_until_retries_run_out(request_timing, request):
+    retries = 2
+    policy = RetryPolicy(retries=retries, backoff_factor=0.0, max_backoff=0.0)
+
+    with FakeOwmServer(error_rate=1.0) as server:
+        client = ApiClient(server.url, retry_policy=policy, observers=[request_timing])
+        with client:
+            response = WeatherService(client).get_weather(DEFAULT_CITY, server.api_key)
+
+    assert response.status_code == 500
+    assert server.requests[("/weather", 500)] == retries + 1
+
+    counters = counters_for(request_timing, request)
+    assert counters["calls"] == retries + 1
+    assert counters["retries"] == retries
+
+
+@pytest.mark.resilience
+@pytest.mark.positive
+def test_throttled_request_succeeds_after_retry(request_timing, request):
+    policy = RetryPolicy(retries=1, backoff_factor=0.0, max_backoff=0.6)
+
+    with FakeOwmServer(requests_per_second=2) as server:
+        client = ApiClient(server.url, retry_policy=policy, observers=[request_timing])
+        with client:
+            weather = WeatherService(client)
+            responses = [
+                weather.get_weather(DEFAULT_CITY, server.api_key) for _ in range(3)
+            ]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert server.requests[("/weather", 429)] == 1
+
+    counters = counters_for(request_timing, request)
+    assert counters["calls"] == 4
+    assert counters["retries"] == 1
+
+
+@pytest.mark.resilience
+@pytest.mark.negative
+def test_circuit_opens_after_consecutive_failures(request_timing):
+    threshold = 2
+    breaker = CircuitBreaker(failure_threshold=threshold, reset_timeout=60.0)
+    policy = RetryPolicy(retries=0)
+
+    with FakeOwmServer(error_rate=1.0) as server:
+        client = ApiClient(
+            server.url,
+            retry_policy=policy,
+            circuit_breaker=breaker,
+            observers=[request_timing],
+        )
+        with client:
+            weather = WeatherService(client)
+            statuses = [
+                weather.get_weather(DEFAULT_CITY, server.api_key).status_code
+                for _ in range(threshold)
+            ]
+
+            with pytest.raises(CircuitOpen):
+                weather.get_weather(DEFAULT_CITY, server.api_key)
+
+    assert statuses == [500] * threshold
+
+    assert breaker.state("/weather") == OPEN
+    assert server.requests[("/weather", 500)] == threshold
+
+
+@pytest.mark.resilience
+@pytest.mark.positive
+def test_slow_request_is_hedged_past_the_latency_threshold(request_timing, request):
+    hedge = HedgePolicy(min_samples=5, min_delay=0.05)
+    hedged = threading.Event()
+
+    def on_hedged(event):
+        if event.hedged:
+            hedged.set()
+
+    with FakeOwmServer() as server:
+        observers = [request_timing, on_hedged]
+        client = ApiClient(server.url, hedge=hedge, observers=observers)
+        with client:
+            weather = WeatherService(client)
+            for _ in range(hedge.min_samples):
+                weather.get_weather(DEFAULT_CITY, server.api_key).raise_for_status()
+            assert counters_for(request_timing, request)["hedges"] == 0
+
+            server.latency = LatencyModel.parse("fixed:0.3")
+            response = weather.get_weather(DEFAULT_CITY, server.api_key)
+
+            assert response.status_code == 200
+            assert hedged.wait(timeout=5), "No hedged request was sent"
+
+    assert counters_for(request_timing, request)["hedges"] == 1
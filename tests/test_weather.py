@@ -1,4 +1,3 @@
-from jsonschema import validate
 from helpers.assertions import assert_city_name
 from helpers.assertions import assert_error_message_present
 from helpers.assertions import assert_within_tolerance
@@ -19,11 +18,13 @@ from helpers.get_temperature import (
     get_temperature_for_city,
 )
 from utils.temp_converter import kelvin_to_celsius, kelvin_to_fahrenheit
+from services.weather_service import WeatherService
 import pytest
 
 
 @pytest.mark.weather
 @pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
 def test_weather_returns_valid_data_for_single_city(weather, api_key):
     city = DEFAULT_CITY
 
@@ -35,27 +36,46 @@ def test_weather_returns_valid_data_for_single_city(weather, api_key):
 
 @pytest.mark.weather
 @pytest.mark.positive
-def test_weather_returns_valid_data_for_all_tested_cities(weather, api_key, cities):
-    for city in cities:
-        response = weather.get_weather(city, api_key)
-        data = assert_status_code_and_valid_json(response)
+@pytest.mark.cities
+@pytest.mark.prefetch("/weather", q="{city}")
+def test_weather_returns_valid_data_for_city(weather, api_key, city):
+    response = weather.get_weather(city, api_key)
+    data = assert_status_code_and_valid_json(response)
 
-        assert_city_name(data, city)
+    assert_city_name(data, city)
 
 
 @pytest.mark.weather
 @pytest.mark.positive
+def test_weather_bulk_returns_data_for_all_city_ids(weather, api_key, city_locations):
+    expected = {
+        location["id"]: location["name"]
+        for location in city_locations
+        if location["id"] is not None
+    }
+
+    results = weather.get_weather_bulk(list(expected), api_key)
+
+    assert set(results) == set(expected)
+    for city_id, data in results.items():
+        assert_city_name(data, expected[city_id])
+
+
+@pytest.mark.weather
+@pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY, units="metric")
 def test_weather_returns_temperature_in_celsius_when_units_metric(weather, api_key):
     city = DEFAULT_CITY
 
     response_kelvin = weather.get_weather(city, api_key)
     response_celsius = weather.get_weather(city, api_key, units="metric")
 
-    assert_status_code_and_valid_json(response_kelvin)
+    data_kelvin = assert_status_code_and_valid_json(response_kelvin)
     assert_status_code_and_valid_json(response_celsius)
 
-    temp_kelvin = get_temperature_for_city(weather, api_key, city)
-    temp_celsius = get_temperature_in_celsius(weather, api_key, city)
+    temp_kelvin = get_temperature_for_city(weather, api_key, city, data=data_kelvin)
+    temp_celsius = get_temperature_in_celsius(weather, api_key, city, data=data_kelvin)
 
     temp_converted = kelvin_to_celsius(temp_kelvin)
 
@@ -66,17 +86,21 @@ def test_weather_returns_temperature_in_celsius_when_units_metric(weather, api_k
 
 @pytest.mark.weather
 @pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY, units="imperial")
 def test_weather_returns_temperature_in_f_when_units_imperial(weather, api_key):
     city = DEFAULT_CITY
 
     response_kelvin = weather.get_weather(city, api_key)
     response_fahrenheit = weather.get_weather(city, api_key, units="imperial")
 
-    assert_status_code_and_valid_json(response_kelvin)
+    data_kelvin = assert_status_code_and_valid_json(response_kelvin)
     assert_status_code_and_valid_json(response_fahrenheit)
 
-    temp_kelvin = get_temperature_for_city(weather, api_key, city)
-    temp_fahrenheit = get_temperature_in_fahrenheit(weather, api_key, city)
+    temp_kelvin = get_temperature_for_city(weather, api_key, city, data=data_kelvin)
+    temp_fahrenheit = get_temperature_in_fahrenheit(
+        weather, api_key, city, data=data_kelvin
+    )
 
     temp_converted = kelvin_to_fahrenheit(temp_kelvin)
 
@@ -87,6 +111,8 @@ def test_weather_returns_temperature_in_f_when_units_imperial(weather, api_key):
 
 @pytest.mark.weather
 @pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY, lang="pl")
 def test_weather_returns_polish_when_language_PL(weather, api_key):
     city = DEFAULT_CITY
 
@@ -107,6 +133,7 @@ def test_weather_returns_polish_when_language_PL(weather, api_key):
 
 @pytest.mark.weather
 @pytest.mark.positive
+@pytest.mark.no_cache
 def test_weather_can_be_requested_by_lat_and_lon(weather, api_key):
     lat = DEFAULT_COORDINATES["lat"]
     lon = DEFAULT_COORDINATES["lon"]
@@ -116,7 +143,7 @@ def test_weather_can_be_requested_by_lat_and_lon(weather, api_key):
 
     data = assert_status_code_and_valid_json(response)
 
-    temp = get_temperature_for_city(weather, api_key=api_key, lat=lat, lon=lon)
+    temp = get_temperature_for_city(weather, api_key=api_key, data=data)
 
     assert_coordinates_match(
         lat, lon, data["coord"]["lat"], data["coord"]["lon"], tolerance
@@ -126,18 +153,38 @@ def test_weather_can_be_requested_by_lat_and_lon(weather, api_key):
 
 @pytest.mark.weather
 @pytest.mark.positive
-def test_weather_response_matches_schema(weather, api_key, weather_schema):
+@pytest.mark.prefetch("/weather", **DEFAULT_COORDINATES)
+def test_weather_model_matches_requested_coordinates(weather, api_key, geo_index):
+    lat = DEFAULT_COORDINATES["lat"]
+    lon = DEFAULT_COORDINATES["lon"]
+    place = geo_index.nearest(lat, lon)
+
+    model = weather.get_weather_model(api_key=api_key, lat=lat, lon=lon)
+    response = weather.get_weather(api_key=api_key, lat=lat, lon=lon)
+    data = assert_status_code_and_valid_json(response)
+
+    assert_coordinates_match(
+        lat, lon, model.coord.lat, model.coord.lon, COORDINATES_TOLERANCE
+    )
+    assert (model.city_id, model.name) == (place["id"], place["name"])
+    assert model.temp == data["main"]["temp"]
+    assert model.description == data["weather"][0]["description"]
+
+
+@pytest.mark.weather
+@pytest.mark.positive
+@pytest.mark.prefetch("/weather", q=DEFAULT_CITY)
+def test_weather_response_matches_schema(weather, api_key, weather_validator):
     city = DEFAULT_CITY
 
     response = weather.get_weather(city, api_key)
     data = assert_status_code_and_valid_json(response)
-    schema = weather_schema
-
-    validate(instance=data, schema=schema)
+    weather_validator.validate(data)
 
 
 @pytest.mark.weather
 @pytest.mark.negative
+@pytest.mark.prefetch("/weather", q=UNKNOWN_CITY)
 def test_weather_returns_404_for_non_existing_city(weather, api_key):
     city = UNKNOWN_CITY
     error_substring = "city"
@@ -228,6 +275,7 @@ def test_weather_returns_400_when_coordinates_null(weather, api_key):
 
 @pytest.mark.weather
 @pytest.mark.positive
+@pytest.mark.no_cache
 def test_weather_can_be_requested_by_city_id(weather, api_key):
     city_id = DEFAULT_CITY_ID
 
@@ -235,3 +283,44 @@ def test_weather_can_be_requested_by_city_id(weather, api_key):
     data = assert_status_code_and_valid_json(response)
 
     assert_city_name(data, "warsaw")
+
+
+@pytest.mark.weather
+@pytest.mark.positive
+def test_weather_response_is_kept_in_http_cache(client, http_cache, api_key):
+    if http_cache is None:
+        pytest.skip("HTTP cache is disabled for this run")
+
+    params = WeatherService.build_params(DEFAULT_CITY, api_key, lang="de")
+    response = client.get("/weather", params=params)
+    data = assert_status_code_and_valid_json(response)
+
+    entry = http_cache.lookup(f"{client.base_url}/weather", params)
+
+    assert entry is not None, "Weather response was not stored in the HTTP cache"
+    assert entry.to_response().json() == data
+
+
+@pytest.mark.weather
+@pytest.mark.positive
+def test_weather_by_name_id_and_coordinates_is_fetched_once(
+    weather, api_key, geo_index, request_timing, request
+):
+    lat = DEFAULT_COORDINATES["lat"]
+    lon = DEFAULT_COORDINATES["lon"]
+
+    responses = [
+        weather.get_weather(DEFAULT_CITY, api_key),
+        weather.get_weather(city_id=DEFAULT_CITY_ID, api_key=api_key),
+        weather.get_weather(api_key=api_key, lat=lat, lon=lon),
+    ]
+
+    for response in responses:
+        data = assert_status_code_and_valid_json(response)
+        assert geo_index.coordinates_match(
+            DEFAULT_CITY, data["coord"]["lat"], data["coord"]["lon"]
+        ), f"{data['coord']} is not within {COORDINATES_TOLERANCE} of {DEFAULT_CITY}"
+
+    counters = request_timing.tests[request.node.nodeid]
+    fetched = counters["calls"] - counters["cache_hits"]
+    assert fetched <= 1, f"Expected at most one fetch for one place, got {fetched}"
@@ -1,5 +1,73 @@
-from utils.json_loader import load_json
+import csv
+import json
+import random
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from utils.json_loader import BASE_DIR, load_json
+
+CITIES_PATH = "data/cities.json"
 
 
 def load_cities() -> list[str]:
-    return load_json("data/cities.json")
+    return load_json(CITIES_PATH)
+
+
+def load_city_locations() -> list[dict]:
+    return load_json("data/city_locations.json")
+
+
+def _city_name(value: str | dict) -> str:
+    return value["name"] if isinstance(value, dict) else value
+
+
+def iter_cities(path: str | Path = CITIES_PATH) -> Iterator[str]:
+    path = BASE_DIR / path
+
+    if path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield _city_name(json.loads(line))
+
+    elif path.suffix == ".csv":
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                yield row["name"]
+
+    else:
+        with open(path, encoding="utf-8") as f:
+            for value in json.load(f):
+                yield _city_name(value)
+
+
+def sample_cities(
+    cities: Iterable[str], size: int, seed: int | None = None
+) -> list[str]:
+    rng = random.Random(seed)
+    reservoir: list[str] = []
+
+    for seen, city in enumerate(cities):
+        if seen < size:
+            reservoir.append(city)
+            continue
+        slot = rng.randrange(seen + 1)
+        if slot < size:
+            reservoir[slot] = city
+
+    return reservoir
+
+
+def shard_cities(
+    cities: Iterable[str], shard_index: int, shard_count: int
+) -> Iterator[str]:
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Shard index {shard_index} is not in 0..{shard_count - 1}")
+    return islice(cities, shard_index, None, shard_count)
+
+
+def chunk_cities(cities: Iterable[str], size: int) -> Iterator[list[str]]:
+    cities = iter(cities)
+    while chunk := list(islice(cities, size)):
+        yield chunk
@@ -0,0 +1,160 @@
+import math
+
+from constants import COORDINATES_TOLERANCE
+from utils.cities_loader import load_city_locations
+
+LOCATION_PARAMS = ("q", "id", "lat", "lon")
+
+
+def place_key(place: dict) -> str:
+    if place.get("id") is not None:
+        return f"id:{place['id']}"
+    return f"name:{place['name'].lower()}"
+
+
+class GeoIndex:
+    def __init__(self, tolerance: float = COORDINATES_TOLERANCE):
+        self.tolerance = tolerance
+        self.columns = math.ceil(360 / tolerance)
+        self.by_name: dict[str, dict] = {}
+        self.by_id: dict[str, dict] = {}
+        self._cells: dict[tuple[int, int], list[dict]] = {}
+
+    @classmethod
+    def from_locations(
+        cls, locations: list[dict], tolerance: float = COORDINATES_TOLERANCE
+    ) -> "GeoIndex":
+        index = cls(tolerance)
+        for location in locations:
+            index.add(
+                location["name"],
+                location.get("id"),
+                location["lat"],
+                location["lon"],
+                country=location.get("country"),
+                aliases=location.get("aliases", ()),
+            )
+        return index
+
+    @classmethod
+    def load(cls, tolerance: float = COORDINATES_TOLERANCE) -> "GeoIndex":
+        return cls.from_locations(load_city_locations(), tolerance)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        row = math.floor(lat / self.tolerance)
+        column = math.floor((lon + 180) / self.tolerance) % self.columns
+        return row, column
+
+    def add(
+        self,
+        name: str,
+        city_id: int | None,
+        lat: float,
+        lon: float,
+        country: str | None = None,
+        aliases: tuple[str, ...] | list[str] = (),
+    ) -> dict:
+        place = self.by_id.get(str(city_id)) if city_id is not None else None
+        if place is None:
+            place = self.by_name.get(name.lower())
+
+        if place is None:
+            place = {"id": city_id, "name": name, "lat": lat, "lon": lon}
+            self._cells.setdefault(self._cell(lat, lon), []).append(place)
+        elif place.get("id") is None and city_id is not None:
+            place["id"] = city_id
+
+        if country and not place.get("country"):
+            place["country"] = country
+        for alias in [name, *aliases]:
+            self.by_name.setdefault(alias.lower(), place)
+        if place.get("id") is not None:
+            self.by_id[str(place["id"])] = place
+
+        return place
+
+    def add_response(self, data: dict) -> dict | None:
+        if "city" in data:
+            data = data["city"]
+        if "list" in data:
+            for item in data["list"]:
+                self.add_response(item)
+            return None
+        if not data.get("name") or "coord" not in data:
+            return None
+
+        return self.add(
+            data["name"],
+            data.get("id"),
+            data["coord"]["lat"],
+            data["coord"]["lon"],
+            country=data.get("country") or data.get("sys", {}).get("country"),
+        )
+
+    def nearest(
+        self, lat: float, lon: float, tolerance: float | None = None
+    ) -> dict | None:
+        tolerance = self.tolerance if tolerance is None else tolerance
+        reach = math.ceil(tolerance / self.tolerance)
+        row, column = self._cell(lat, lon)
+        best = None
+        best_distance = math.inf
+
+        for row_offset in range(-reach, reach + 1):
+            for column_offset in range(-reach, reach + 1):
+                cell = (row + row_offset, (column + column_offset) % self.columns)
+                for place in self._cells.get(cell, ()):
+                    lat_difference = abs(place["lat"] - lat)
+                    lon_difference = abs(place["lon"] - lon)
+                    lon_difference = min(lon_difference, 360 - lon_difference)
+                    if lat_difference > tolerance or lon_difference > tolerance:
+                        continue
+                    distance = lat_difference**2 + lon_difference**2
+                    if distance < best_distance:
+                        best, best_distance = place, distance
+
+        return best
+
+    def lookup_name(self, query: str) -> dict | None:
+        name, *qualifiers = [part.strip() for part in query.split(",")]
+        place = self.by_name.get(name.lower())
+
+        if place is None or not qualifiers:
+            return place
+        if place.get("country", "").lower() != qualifiers[-1].lower():
+            return None
+        return place
+
+    def resolve(self, params: dict) -> dict | None:
+        if params.get("q"):
+            return self.lookup_name(str(params["q"]))
+
+        if params.get("id") is not None:
+            return self.by_id.get(str(params["id"]))
+
+        if params.get("lat") is not None and params.get("lon") is not None:
+            try:
+                lat = float(params["lat"])
+                lon = float(params["lon"])
+            except (TypeError, ValueError):
+                return None
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                return None
+            return self.nearest(lat, lon)
+
+        return None
+
+    def coordinates_match(
+        self, city: str | int, lat: float, lon: float, tolerance: float | None = None
+    ) -> bool:
+        place = self.by_id.get(str(city)) or self.lookup_name(str(city))
+        if place is None:
+            raise KeyError(f"{city!r} is not in the geo index")
+        tolerance = self.tolerance if tolerance is None else tolerance
+        return (
+            abs(place["lat"] - lat) <= tolerance
+            and abs(place["lon"] - lon) <= tolerance
+        )
+
+    def __len__(self) -> int:
+        return sum(len(places) for places in self._cells.values())
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+from utils.schema_loader import load_schema
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+FORECAST_ENTRY_PATH = ("properties", "list", "items")
+
+
+@lru_cache(maxsize=None)
+def get_schema(name: str) -> dict:
+    return load_schema(name)
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str, path: tuple[str, ...] = ()) -> Validator:
+    from jsonschema.validators import validator_for
+
+    schema = get_schema(name)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+
+    for key in path:
+        schema = schema[key]
+
+    return validator_class(schema)
+
+
+def validate_schema(instance: dict | list, name: str, path: tuple[str, ...] = ()):
+    get_validator(name, path).validate(instance)
+
+
+def validate_many(instances: Iterable, name: str, path: tuple[str, ...] = ()):
+    from jsonschema import ValidationError
+    from jsonschema.exceptions import best_match
+
+    validator = get_validator(name, path)
+    failures = []
+    total = 0
+
+    for index, instance in enumerate(instances):
+        total += 1
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            failures.append((index, error))
+
+    if failures:
+        details = "; ".join(f"[{index}] {error.message}" for index, error in failures)
+        raise ValidationError(
+            f"{len(failures)} of {total} instances do not match {name}: {details}"
+        )
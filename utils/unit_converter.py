@@ -0,0 +1,82 @@
+from array import array
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional, pure Python fallback below
+    np = None
+
+STANDARD = "standard"
+METRIC = "metric"
+IMPERIAL = "imperial"
+UNITS = (STANDARD, METRIC, IMPERIAL)
+
+# Each unit as an affine map onto the standard unit: standard = value * a + b
+TEMPERATURE_TO_STANDARD = {
+    STANDARD: (1.0, 0.0),  # kelvin
+    METRIC: (1.0, 273.15),  # celsius
+    IMPERIAL: (5 / 9, 273.15 - 32 * 5 / 9),  # fahrenheit
+}
+WIND_SPEED_TO_STANDARD = {
+    STANDARD: (1.0, 0.0),  # meter/sec
+    METRIC: (1.0, 0.0),  # meter/sec
+    IMPERIAL: (0.44704, 0.0),  # miles/hour
+}
+PRESSURE_TO_STANDARD = {
+    STANDARD: (1.0, 0.0),  # hPa in every units mode
+    METRIC: (1.0, 0.0),
+    IMPERIAL: (1.0, 0.0),
+}
+
+Values = float | Sequence[float] | array
+
+
+def _affine(table: dict, from_units: str | None, to_units: str | None):
+    from_units = from_units or STANDARD
+    to_units = to_units or STANDARD
+
+    for units in (from_units, to_units):
+        if units not in table:
+            raise ValueError(f"Unknown units {units!r}, expected one of {UNITS}")
+
+    from_scale, from_offset = table[from_units]
+    to_scale, to_offset = table[to_units]
+
+    scale = from_scale / to_scale
+    offset = (from_offset - to_offset) / to_scale
+    return scale, offset
+
+
+def _apply(values: Values, scale: float, offset: float) -> Values:
+    if isinstance(values, (int, float)):
+        return values * scale + offset
+
+    if np is not None:
+        if isinstance(values, np.ndarray):
+            return values * scale + offset
+        if isinstance(values, array):
+            converted = np.frombuffer(values, dtype=values.typecode) * scale + offset
+            return array("d", converted.tobytes())
+        return (np.asarray(values, dtype=float) * scale + offset).tolist()
+
+    if isinstance(values, array):
+        return array("d", [value * scale + offset for value in values])
+    return [value * scale + offset for value in values]
+
+
+def convert_temperature(
+    values: Values, from_units: str | None = STANDARD, to_units: str | None = METRIC
+) -> Values:
+    return _apply(values, *_affine(TEMPERATURE_TO_STANDARD, from_units, to_units))
+
+
+def convert_wind_speed(
+    values: Values, from_units: str | None = STANDARD, to_units: str | None = IMPERIAL
+) -> Values:
+    return _apply(values, *_affine(WIND_SPEED_TO_STANDARD, from_units, to_units))
+
+
+def convert_pressure(
+    values: Values, from_units: str | None = STANDARD, to_units: str | None = METRIC
+) -> Values:
+    return _apply(values, *_affine(PRESSURE_TO_STANDARD, from_units, to_units))